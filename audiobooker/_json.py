@@ -0,0 +1,61 @@
+"""
+JSON encoding shared by project files, render caches and reports.
+
+orjson is used when installed; stdlib json is the fallback. Both produce
+the same bytes for str, int, bool and None. Floats can be formatted
+differently (orjson writes 1e-05 as 0.00001), which still parses back to
+the same value but changes the bytes, so canonical_bytes() sends any
+value containing a float through json.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize as 2-space indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def canonical_bytes(obj: Any) -> bytes:
+    """
+    Canonical JSON (sorted keys, no whitespace) as UTF-8 bytes.
+
+    Byte-identical with or without orjson, so it is safe to hash.
+    Values containing floats, non-str keys or ints orjson can't encode
+    use json.
+    """
+    if orjson is not None and not _contains_float(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    canonical = json.dumps(obj, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return canonical.encode("utf-8")
+
+
+def loads(raw: bytes | str) -> Any:
+    """Parse JSON (orjson.JSONDecodeError subclasses json's)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _contains_float(obj: Any) -> bool:
+    """True if a float appears anywhere in a JSON-like value."""
+    if isinstance(obj, float):
+        return True
+    if isinstance(obj, dict):
+        return any(_contains_float(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_contains_float(v) for v in obj)
+    return False
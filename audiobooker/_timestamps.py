@@ -0,0 +1,27 @@
+"""
+ISO-8601 timestamps for project and cache records.
+
+Timestamps have second resolution (no microseconds). The formatted string
+is reused until the wall-clock second changes, so stamping many records
+in a loop formats the time once per second.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, tzinfo
+from typing import Optional
+
+# tz -> (epoch second, formatted timestamp) of the last call
+_last: dict[Optional[tzinfo], tuple[int, str]] = {}
+
+
+def now_iso(tz: Optional[tzinfo] = None) -> str:
+    """Current time as ISO-8601, in ``tz`` (local time if None)."""
+    sec = time.time_ns() // 1_000_000_000
+    cached = _last.get(tz)
+    if cached is not None and cached[0] == sec:
+        return cached[1]
+    stamp = datetime.fromtimestamp(sec, tz).isoformat()
+    _last[tz] = (sec, stamp)
+    return stamp
@@ -19,6 +19,7 @@ are drawn from a LanguageProfile.  Default is English.
 """
 
 import re
+from functools import lru_cache
 from typing import Optional
 
 from audiobooker.models import Chapter, Utterance, UtteranceType, CastingTable
@@ -32,41 +33,35 @@ from audiobooker.language.profile import LanguageProfile, get_profile
 def _build_quote_patterns(
     profile: LanguageProfile,
     include_single_quotes: bool = False,
-) -> list[tuple[re.Pattern, bool]]:
+) -> tuple[tuple[re.Pattern, bool], ...]:
     """
     Compile regex patterns for detecting quoted segments.
 
-    Returns list of (pattern, is_dialogue) tuples.
+    Returns (pattern, is_dialogue) tuples, in priority order: double
+    quotes, smart/curly quotes, then single quotes (optional).
     Each pattern has one capture group for the quoted content.
     """
-    patterns = []
-
-    # Double quotes
-    for open_q, close_q in profile.dialogue_quotes:
-        pat = re.compile(
-            rf'{re.escape(open_q)}([^{re.escape(close_q)}]+){re.escape(close_q)}',
-            re.DOTALL,
-        )
-        patterns.append((pat, True))
-
-    # Smart/curly quotes
-    for open_q, close_q in profile.smart_quotes:
-        pat = re.compile(
-            rf'{re.escape(open_q)}([^{re.escape(close_q)}]+){re.escape(close_q)}',
-            re.DOTALL,
-        )
-        patterns.append((pat, True))
-
-    # Single quotes (optional)
+    pairs = profile.dialogue_quotes + profile.smart_quotes
     if include_single_quotes:
-        for open_q, close_q in profile.single_quotes:
-            pat = re.compile(
+        pairs += profile.single_quotes
+    return _compile_quote_patterns(pairs)
+
+
+@lru_cache(maxsize=32)
+def _compile_quote_patterns(
+    pairs: tuple[tuple[str, str], ...],
+) -> tuple[tuple[re.Pattern, bool], ...]:
+    """Compile one pattern per (open, close) quote pair; cached per pair set."""
+    return tuple(
+        (
+            re.compile(
                 rf'{re.escape(open_q)}([^{re.escape(close_q)}]+){re.escape(close_q)}',
                 re.DOTALL,
-            )
-            patterns.append((pat, True))
-
-    return patterns
+            ),
+            True,
+        )
+        for open_q, close_q in pairs
+    )
 
 
 # Inline override pattern: [Character|emotion] or [Character]
@@ -249,8 +244,8 @@ def extract_speaker_from_context(
 
     context = window_before + " " + window_after
 
-    said_patterns = profile.build_said_patterns()
-    emotion_pattern = profile.build_emotion_verb_pattern()
+    said_patterns = profile.said_patterns
+    emotion_pattern = profile.emotion_verb_pattern
 
     for pattern in said_patterns:
         match = pattern.search(context)
@@ -372,13 +367,18 @@ def compile_chapter(
             line_index += 1
 
     # Update character line counts in casting table
+    tally_line_counts(utterances, casting)
+
+    return utterances
+
+
+def tally_line_counts(utterances: list[Utterance], casting: CastingTable) -> None:
+    """Add each utterance to its cast character's line_count."""
     for utterance in utterances:
         key = casting.normalize_key(utterance.speaker)
         if key in casting.characters:
             casting.characters[key].line_count += 1
 
-    return utterances
-
 
 def utterances_to_script(
     utterances: list[Utterance],
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Optional
 
 
@@ -41,20 +42,69 @@ class LanguageProfile:
     chapter_patterns: tuple[str, ...] = ()
     scene_break_patterns: tuple[str, ...] = ()
 
-    def normalize_name(self, name: str) -> str:
-        """Canonical form for speaker lookup keys."""
-        return name.casefold().strip()
+    def __post_init__(self) -> None:
+        # Pattern collections are used as cache keys; store them as tuples
+        # even if a caller passes lists.
+        for name in ("chapter_patterns", "scene_break_patterns"):
+            value = getattr(self, name)
+            if not isinstance(value, tuple):
+                object.__setattr__(self, name, tuple(value))
+
+    @cached_property
+    def compiled_chapter_patterns(self) -> tuple[re.Pattern, ...]:
+        """Chapter patterns compiled once per profile (MULTILINE)."""
+        return tuple(re.compile(p, re.MULTILINE) for p in self.chapter_patterns)
+
+    @cached_property
+    def chapter_scanner(self) -> Optional[re.Pattern]:
+        """
+        All chapter patterns fused into one regex.
+
+        Each pattern becomes an optional lookahead followed by an empty
+        group named ``_c<index>``, so a single ``match()`` reports every
+        pattern a line satisfies. None if the patterns cannot be combined
+        (e.g. they use inline global flags or clash with the group names).
+        """
+        if not self.chapter_patterns:
+            return None
+        parts = [
+            f"(?:(?={p})(?P<_c{i}>))?"
+            for i, p in enumerate(self.chapter_patterns)
+        ]
+        try:
+            return re.compile("".join(parts), re.MULTILINE)
+        except re.error:
+            return None
 
-    def is_valid_name(self, name: str) -> bool:
-        """Check if a string looks like a valid speaker name."""
-        return bool(re.match(self.valid_name_pattern, name))
+    @cached_property
+    def scene_break_re(self) -> Optional[re.Pattern]:
+        """
+        Scene break patterns fused into one alternation.
 
-    def build_said_patterns(self) -> list[re.Pattern]:
-        """Build compiled verb-name / name-verb regex patterns."""
+        None if there are no patterns or they cannot be combined (e.g.
+        inline global flags); callers then match each pattern in turn.
+        """
+        if not self.scene_break_patterns:
+            return None
+        try:
+            return re.compile(
+                "|".join(f"(?:{p})" for p in self.scene_break_patterns)
+            )
+        except re.error:
+            return None
+
+    @cached_property
+    def valid_name_re(self) -> re.Pattern:
+        """Compiled valid_name_pattern (cached)."""
+        return re.compile(self.valid_name_pattern)
+
+    @cached_property
+    def said_patterns(self) -> tuple[re.Pattern, ...]:
+        """Compiled verb-name / name-verb patterns (cached)."""
         if not self.speaker_verbs:
-            return []
+            return ()
         verb_alt = "|".join(re.escape(v) for v in sorted(self.speaker_verbs))
-        return [
+        return (
             # "said Alice" — verb then name
             re.compile(
                 rf"(?:{verb_alt})\s+([A-Z][a-z]+)(?:\s|[,.\!\?]|$)",
@@ -65,16 +115,33 @@ class LanguageProfile:
                 rf"([A-Z][a-z]+)\s+(?:{verb_alt})",
                 re.IGNORECASE,
             ),
-        ]
+        )
 
-    def build_emotion_verb_pattern(self) -> Optional[re.Pattern]:
-        """Build a pattern matching verbs that carry emotion hints."""
+    @cached_property
+    def emotion_verb_pattern(self) -> Optional[re.Pattern]:
+        """Compiled pattern for verbs that carry emotion hints (cached)."""
         keys = [k for k in self.emotion_hints if k in self.speaker_verbs]
         if not keys:
             return None
         alt = "|".join(re.escape(k) for k in sorted(keys))
         return re.compile(rf"\b({alt})\b", re.IGNORECASE)
 
+    def normalize_name(self, name: str) -> str:
+        """Canonical form for speaker lookup keys."""
+        return name.casefold().strip()
+
+    def is_valid_name(self, name: str) -> bool:
+        """Check if a string looks like a valid speaker name."""
+        return self.valid_name_re.match(name) is not None
+
+    def build_said_patterns(self) -> list[re.Pattern]:
+        """Build compiled verb-name / name-verb regex patterns."""
+        return list(self.said_patterns)
+
+    def build_emotion_verb_pattern(self) -> Optional[re.Pattern]:
+        """Build a pattern matching verbs that carry emotion hints."""
+        return self.emotion_verb_pattern
+
 
 # ---------------------------------------------------------------------------
 # Registry
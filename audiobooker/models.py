@@ -21,7 +21,13 @@ class UtteranceType(Enum):
     DIALOGUE = "dialogue"
 
 
-@dataclass
+# Plain dict lookups for (de)serialization; Enum.__call__ and .value are
+# noticeably slower when a project holds many utterances.
+_UTTERANCE_TYPE_BY_VALUE = {t.value: t for t in UtteranceType}
+_UTTERANCE_TYPE_VALUE = {t: t.value for t in UtteranceType}
+
+
+@dataclass(slots=True)
 class Utterance:
     """
     A single spoken unit in the audiobook.
@@ -51,23 +57,29 @@ class Utterance:
         return f"[S1:{self.speaker}] {emotion_part}{self.text}"
 
     def to_dict(self) -> dict:
-        """Serialize to dictionary."""
-        return {
+        """Serialize to dictionary (unset emotion is omitted)."""
+        data = {
             "speaker": self.speaker,
             "text": self.text,
-            "type": self.utterance_type.value,
-            "emotion": self.emotion,
+            "type": _UTTERANCE_TYPE_VALUE[self.utterance_type],
             "chapter_index": self.chapter_index,
             "line_index": self.line_index,
         }
+        if self.emotion is not None:
+            data["emotion"] = self.emotion
+        return data
 
     @classmethod
     def from_dict(cls, data: dict) -> "Utterance":
         """Deserialize from dictionary."""
+        type_value = data.get("type", "narration")
+        utterance_type = _UTTERANCE_TYPE_BY_VALUE.get(type_value)
+        if utterance_type is None:
+            utterance_type = UtteranceType(type_value)  # raises ValueError
         return cls(
             speaker=data["speaker"],
             text=data["text"],
-            utterance_type=UtteranceType(data.get("type", "narration")),
+            utterance_type=utterance_type,
             emotion=data.get("emotion"),
             chapter_index=data.get("chapter_index", 0),
             line_index=data.get("line_index", 0),
@@ -95,11 +107,26 @@ class Chapter:
     source_file: Optional[str] = None
     audio_path: Optional[Path] = None
     duration_seconds: float = 0.0
+    # (raw_text object, its render-cache hash); reused while raw_text is
+    # the very same string. See renderer.hash_utils.chapter_text_hash.
+    _text_hash_cache: Optional[tuple[str, str]] = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+    # (raw_text object, its word count), likewise reused
+    _word_count_cache: Optional[tuple[str, int]] = field(
+        default=None, init=False, repr=False, compare=False,
+    )
 
     @property
     def word_count(self) -> int:
-        """Approximate word count."""
-        return len(self.raw_text.split())
+        """Approximate word count (recounted only when raw_text changes)."""
+        text = self.raw_text
+        cached = self._word_count_cache
+        if cached is not None and cached[0] is text:
+            return cached[1]
+        count = len(text.split())
+        self._word_count_cache = (text, count)
+        return count
 
     @property
     def estimated_duration_minutes(self) -> float:
@@ -111,22 +138,30 @@ class Chapter:
         """Check if chapter has been compiled to utterances."""
         return len(self.utterances) > 0
 
+    @property
+    def speakers(self) -> set[str]:
+        """Distinct speakers in this chapter's utterances."""
+        return {u.speaker for u in self.utterances}
+
     @property
     def is_rendered(self) -> bool:
         """Check if chapter has been rendered to audio."""
         return self.audio_path is not None and self.audio_path.exists()
 
     def to_dict(self) -> dict:
-        """Serialize to dictionary."""
-        return {
+        """Serialize to dictionary (unset source_file/audio_path are omitted)."""
+        data = {
             "index": self.index,
             "title": self.title,
             "raw_text": self.raw_text,
             "utterances": [u.to_dict() for u in self.utterances],
-            "source_file": self.source_file,
-            "audio_path": str(self.audio_path) if self.audio_path else None,
             "duration_seconds": self.duration_seconds,
         }
+        if self.source_file is not None:
+            data["source_file"] = self.source_file
+        if self.audio_path:
+            data["audio_path"] = str(self.audio_path)
+        return data
 
     @classmethod
     def from_dict(cls, data: dict) -> "Chapter":
@@ -321,6 +356,10 @@ class ProjectConfig:
         booknlp_mode: NLP speaker resolution: "on"|"off"|"auto" (default "auto")
         emotion_mode: Emotion inference: "off"|"rule"|"auto" (default "rule")
         emotion_confidence_threshold: Minimum confidence to apply inferred emotion
+        compile_workers: Processes used by compile() (1 = in-process, serial)
+        render_workers: Threads rendering chapters concurrently (1 = serial).
+            More than 1 shares one TTS engine across the threads, so its
+            synthesize() must be thread-safe
     """
     chapter_pause_ms: int = 2000
     narrator_pause_ms: int = 600
@@ -336,6 +375,8 @@ class ProjectConfig:
     booknlp_mode: str = "auto"
     emotion_mode: str = "rule"
     emotion_confidence_threshold: float = 0.75
+    compile_workers: int = 1
+    render_workers: int = 1
 
     def to_dict(self) -> dict:
         """Serialize to dictionary."""
@@ -354,6 +395,8 @@ class ProjectConfig:
             "booknlp_mode": self.booknlp_mode,
             "emotion_mode": self.emotion_mode,
             "emotion_confidence_threshold": self.emotion_confidence_threshold,
+            "compile_workers": self.compile_workers,
+            "render_workers": self.render_workers,
         }
 
     @classmethod
@@ -374,4 +417,6 @@ class ProjectConfig:
             booknlp_mode=data.get("booknlp_mode", "auto"),
             emotion_mode=data.get("emotion_mode", "rule"),
             emotion_confidence_threshold=data.get("emotion_confidence_threshold", 0.75),
+            compile_workers=data.get("compile_workers", 1),
+            render_workers=data.get("render_workers", 1),
         )
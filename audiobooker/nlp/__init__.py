@@ -2,11 +2,20 @@
 NLP enhancements for Audiobooker.
 
 Optional intelligence layer for speaker resolution and emotion inference.
+
+Exports are imported on first access, so using one component (e.g. the
+emotion inferencer) does not load the others.
 """
 
-from audiobooker.nlp.booknlp_adapter import BookNLPAdapter, BookNLPResult
-from audiobooker.nlp.speaker_resolver import SpeakerResolver
-from audiobooker.nlp.emotion import EmotionInferencer, EmotionResult
+import importlib
+
+_LAZY_EXPORTS = {
+    "BookNLPAdapter": "audiobooker.nlp.booknlp_adapter",
+    "BookNLPResult": "audiobooker.nlp.booknlp_adapter",
+    "SpeakerResolver": "audiobooker.nlp.speaker_resolver",
+    "EmotionInferencer": "audiobooker.nlp.emotion",
+    "EmotionResult": "audiobooker.nlp.emotion",
+}
 
 __all__ = [
     "BookNLPAdapter",
@@ -15,3 +24,12 @@ __all__ = [
     "EmotionInferencer",
     "EmotionResult",
 ]
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
@@ -13,6 +13,7 @@ User-set explicit emotions are never overridden.
 from __future__ import annotations
 
 import re
+import string
 from dataclasses import dataclass
 from typing import Optional, TYPE_CHECKING
 
@@ -38,37 +39,75 @@ class EmotionResult:
 # Lexicon (small, curated, high-precision)
 # ---------------------------------------------------------------------------
 
-_EMOTION_LEXICON: dict[str, list[tuple[str, float]]] = {
+# Each entry is (pattern, confidence, heads). heads lists the first word of
+# every phrase the pattern can match, as the word prefilter in
+# _check_lexicon sees it ("can't wait" -> "can"); keep it in step with the
+# pattern.
+_EMOTION_LEXICON: dict[str, list[tuple[str, float, tuple[str, ...]]]] = {
     "angry": [
-        (r"\b(?:furious|enraged|livid|seething|infuriated)\b", 0.9),
-        (r"\b(?:angry|mad|outraged|irate|incensed)\b", 0.85),
-        (r"\b(?:annoyed|irritated|frustrated)\b", 0.7),
+        (r"\b(?:furious|enraged|livid|seething|infuriated)\b", 0.9,
+         ("furious", "enraged", "livid", "seething", "infuriated")),
+        (r"\b(?:angry|mad|outraged|irate|incensed)\b", 0.85,
+         ("angry", "mad", "outraged", "irate", "incensed")),
+        (r"\b(?:annoyed|irritated|frustrated)\b", 0.7,
+         ("annoyed", "irritated", "frustrated")),
     ],
     "sad": [
-        (r"\b(?:sobbing|weeping|grieving|mourning|heartbroken)\b", 0.9),
-        (r"\b(?:crying|tears|sorrowful|miserable|devastated)\b", 0.85),
-        (r"\b(?:sad|unhappy|gloomy|melancholy)\b", 0.75),
+        (r"\b(?:sobbing|weeping|grieving|mourning|heartbroken)\b", 0.9,
+         ("sobbing", "weeping", "grieving", "mourning", "heartbroken")),
+        (r"\b(?:crying|tears|sorrowful|miserable|devastated)\b", 0.85,
+         ("crying", "tears", "sorrowful", "miserable", "devastated")),
+        (r"\b(?:sad|unhappy|gloomy|melancholy)\b", 0.75,
+         ("sad", "unhappy", "gloomy", "melancholy")),
     ],
     "happy": [
-        (r"\b(?:ecstatic|overjoyed|elated|jubilant|thrilled)\b", 0.9),
-        (r"\b(?:delighted|joyful|excited|gleeful|beaming)\b", 0.85),
-        (r"\b(?:happy|pleased|cheerful|glad|smiling)\b", 0.75),
+        (r"\b(?:ecstatic|overjoyed|elated|jubilant|thrilled)\b", 0.9,
+         ("ecstatic", "overjoyed", "elated", "jubilant", "thrilled")),
+        (r"\b(?:delighted|joyful|excited|gleeful|beaming)\b", 0.85,
+         ("delighted", "joyful", "excited", "gleeful", "beaming")),
+        (r"\b(?:happy|pleased|cheerful|glad|smiling)\b", 0.75,
+         ("happy", "pleased", "cheerful", "glad", "smiling")),
     ],
     "fearful": [
-        (r"\b(?:terrified|petrified|horrified|panic)\b", 0.9),
-        (r"\b(?:frightened|scared|afraid|alarmed|trembling)\b", 0.85),
-        (r"\b(?:nervous|anxious|worried|uneasy)\b", 0.7),
+        (r"\b(?:terrified|petrified|horrified|panic)\b", 0.9,
+         ("terrified", "petrified", "horrified", "panic")),
+        (r"\b(?:frightened|scared|afraid|alarmed|trembling)\b", 0.85,
+         ("frightened", "scared", "afraid", "alarmed", "trembling")),
+        (r"\b(?:nervous|anxious|worried|uneasy)\b", 0.7,
+         ("nervous", "anxious", "worried", "uneasy")),
     ],
     "whisper": [
-        (r"\b(?:whispered|hissed|murmured|breathed)\b", 0.9),
-        (r"\b(?:softly|quietly|hushed|under\s+(?:his|her|their)\s+breath)\b", 0.8),
+        (r"\b(?:whispered|hissed|murmured|breathed)\b", 0.9,
+         ("whispered", "hissed", "murmured", "breathed")),
+        (r"\b(?:softly|quietly|hushed|under\s+(?:his|her|their)\s+breath)\b", 0.8,
+         ("softly", "quietly", "hushed", "under")),
     ],
     "excited": [
-        (r"\b(?:can't\s+wait|incredible|amazing|fantastic|wonderful)\b", 0.8),
-        (r"\b(?:eager|enthusiastic|pumped|exhilarated)\b", 0.85),
+        (r"\b(?:can't\s+wait|incredible|amazing|fantastic|wonderful)\b", 0.8,
+         ("can", "incredible", "amazing", "fantastic", "wonderful")),
+        (r"\b(?:eager|enthusiastic|pumped|exhilarated)\b", 0.85,
+         ("eager", "enthusiastic", "pumped", "exhilarated")),
     ],
 }
 
+# A lexicon hit needs one of these as a whole word, so a text whose word
+# set misses them all can skip the regex searches entirely.
+_LEXICON_HEADS: frozenset[bytes] = frozenset(
+    head.encode("ascii")
+    for patterns in _EMOTION_LEXICON.values()
+    for _pat, _conf, heads in patterns
+    for head in heads
+)
+
+# Lowercases ASCII letters and blanks out every other non-word byte, so
+# text.encode("ascii", "replace").translate(...).split() yields exactly
+# the words that re.ASCII's \b sees.
+_ASCII_WORD_CHARS = string.ascii_lowercase + string.digits + "_"
+_ASCII_WORD_FOLD = bytes(
+    ord(chr(b).lower()) if chr(b).lower() in _ASCII_WORD_CHARS else ord(" ")
+    for b in range(256)
+)
+
 # Compiled patterns (lazy)
 _COMPILED_LEXICON: Optional[dict[str, list[tuple[re.Pattern, float]]]] = None
 
@@ -80,8 +119,8 @@ def _get_lexicon() -> dict[str, list[tuple[re.Pattern, float]]]:
         _COMPILED_LEXICON = {}
         for emotion, patterns in _EMOTION_LEXICON.items():
             _COMPILED_LEXICON[emotion] = [
-                (re.compile(pat, re.IGNORECASE), conf)
-                for pat, conf in patterns
+                (re.compile(pat, re.IGNORECASE | re.ASCII), conf)
+                for pat, conf, _heads in patterns
             ]
     return _COMPILED_LEXICON
 
@@ -194,7 +233,7 @@ class EmotionInferencer:
 
     def _check_verb_hints(self, text: str) -> Optional[EmotionResult]:
         """Check if text contains emotion-hinting verbs from the profile."""
-        pattern = self.profile.build_emotion_verb_pattern()
+        pattern = self.profile.emotion_verb_pattern
         if pattern is None:
             return None
 
@@ -210,6 +249,10 @@ class EmotionInferencer:
 
     def _check_lexicon(self, text: str) -> Optional[EmotionResult]:
         """Check text against emotion lexicon."""
+        words = text.encode("ascii", "replace").translate(_ASCII_WORD_FOLD).split()
+        if _LEXICON_HEADS.isdisjoint(words):
+            return None
+
         lexicon = _get_lexicon()
         best: Optional[EmotionResult] = None
 
@@ -8,17 +8,40 @@ Otherwise, falls back to existing heuristic attribution (no-op).
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import re
+import sys
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Optional, TYPE_CHECKING
 
-from audiobooker.nlp.booknlp_adapter import BookNLPAdapter, BookNLPResult, NLPBackend
-
 if TYPE_CHECKING:
-    from audiobooker.models import Chapter, Utterance, CastingTable
+    from audiobooker.models import Chapter, CastingTable
+    from audiobooker.nlp.booknlp_adapter import BookNLPResult, NLPBackend
 
 logger = logging.getLogger("audiobooker.nlp.resolver")
 
+# Successful analyses kept per resolver, keyed by a digest of the chapter text
+_ANALYSIS_CACHE_SIZE = 64
+
+
+_PUNCT_RE = re.compile(r"[^\w\s]")
+
+
+def _attribution_key(text: str) -> str:
+    """Normalized lookup key shared by NLP quotes and utterances."""
+    return text.strip().casefold()[:80]
+
+
+def _loose_key(text: str) -> str:
+    """Punctuation- and whitespace-insensitive key for near-exact matches."""
+    return " ".join(_PUNCT_RE.sub("", text.casefold()).split())[:80]
+
+
+# (exact map, loose map) built by SpeakerResolver._build_attribution_map
+_AttributionMaps = tuple[dict[str, str], dict[str, str]]
+
 
 @dataclass
 class ResolutionStats:
@@ -40,26 +63,38 @@ class SpeakerResolver:
         - "off": Never use NLP (pure pass-through).
         - "auto": Use NLP if available, fall back silently.
 
+    Utterances are matched to NLP quotes by exact normalized text, then by
+    text with punctuation/whitespace ignored, then (if ``fuzzy_threshold``
+    is set and rapidfuzz is installed) by fuzzy token-set similarity.
+
     Args:
         mode: "on" | "off" | "auto" (default "auto").
         adapter: Injected NLP backend (defaults to BookNLPAdapter).
+        fuzzy_threshold: Minimum rapidfuzz score (0-100) for the fuzzy tier;
+            None disables it.
     """
 
     def __init__(
         self,
         mode: str = "auto",
         adapter: Optional[NLPBackend] = None,
+        fuzzy_threshold: Optional[float] = None,
     ) -> None:
         if mode not in ("on", "off", "auto"):
             raise ValueError(f"Invalid booknlp_mode: {mode!r}. Must be on|off|auto.")
 
         self.mode = mode
         self._adapter = adapter
+        self.fuzzy_threshold = fuzzy_threshold
+        self._analysis_cache: OrderedDict[
+            bytes, tuple[BookNLPResult, _AttributionMaps]
+        ] = OrderedDict()
 
     @property
     def adapter(self) -> NLPBackend:
         """Lazy-create adapter on first access."""
         if self._adapter is None:
+            from audiobooker.nlp.booknlp_adapter import BookNLPAdapter
             self._adapter = BookNLPAdapter()
         return self._adapter
 
@@ -105,8 +140,16 @@ class SpeakerResolver:
 
             stats.chapters_processed += 1
 
-            # Analyze the full chapter text
-            result = self.adapter.analyze(chapter.raw_text)
+            # Only "unknown" utterances can be improved; if there are none,
+            # the (expensive) analysis is skipped entirely.
+            unknown = [u for u in chapter.utterances if u.speaker == "unknown"]
+            if not unknown:
+                stats.utterances_examined += len(chapter.utterances)
+                stats.speakers_unchanged += len(chapter.utterances)
+                continue
+
+            # Analyze the full chapter text (memoized across passes)
+            result, nlp_attributions = self._analyze(chapter.raw_text)
 
             if not result.success:
                 stats.nlp_error = result.error
@@ -116,28 +159,33 @@ class SpeakerResolver:
                 )
                 continue
 
-            # Build a lookup of quote positions → speakers from NLP
-            nlp_attributions = self._build_attribution_map(result)
-
-            # Try to improve "unknown" utterances
-            for utterance in chapter.utterances:
-                stats.utterances_examined += 1
-
-                if utterance.speaker != "unknown":
-                    stats.speakers_unchanged += 1
-                    continue
-
-                # See if NLP has a better attribution for this text
-                improved = self._match_utterance(utterance, nlp_attributions)
+            stats.utterances_examined += len(chapter.utterances)
+            stats.speakers_unchanged += len(chapter.utterances) - len(unknown)
+
+            # Try to improve "unknown" utterances. Hot loop: bind lookups
+            # locally and only format debug messages when they are emitted.
+            lookup = nlp_attributions[0].get
+            debug = logger.isEnabledFor(logging.DEBUG)
+            resolved = 0
+            for utterance in unknown:
+                # See if NLP has a better attribution for this text; the
+                # slower tiers only run on an exact-key miss.
+                text_key = _attribution_key(utterance.text)
+                improved = lookup(text_key)
+                if not improved:
+                    improved = self._match_inexact(
+                        utterance.text, text_key, nlp_attributions,
+                    )
                 if improved:
                     utterance.speaker = improved
-                    stats.speakers_resolved += 1
-                    logger.debug(
-                        f"Resolved unknown → {improved!r} in ch{chapter.index} "
-                        f"line {utterance.line_index}"
-                    )
-                else:
-                    stats.speakers_unchanged += 1
+                    resolved += 1
+                    if debug:
+                        logger.debug(
+                            f"Resolved unknown → {improved!r} in ch{chapter.index} "
+                            f"line {utterance.line_index}"
+                        )
+            stats.speakers_resolved += resolved
+            stats.speakers_unchanged += len(unknown) - resolved
 
         logger.info(
             f"SpeakerResolver: resolved={stats.speakers_resolved} "
@@ -145,20 +193,77 @@ class SpeakerResolver:
         )
         return stats
 
-    def _build_attribution_map(self, result: BookNLPResult) -> dict[str, str]:
-        """Build a map from normalized quote text → speaker name."""
-        mapping: dict[str, str] = {}
+    def _analyze(self, text: str) -> tuple[BookNLPResult, _AttributionMaps]:
+        """
+        Analyze chapter text and build its attribution maps, with an LRU cache.
+
+        Only successful results are cached, so failures are retried on the
+        next pass.
+        """
+        key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        cached = self._analysis_cache.get(key)
+        if cached is not None:
+            self._analysis_cache.move_to_end(key)
+            return cached
+
+        result = self.adapter.analyze(text)
+        if not result.success:
+            return result, ({}, {})
+
+        entry = (result, self._build_attribution_map(result))
+        self._analysis_cache[key] = entry
+        if len(self._analysis_cache) > _ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
+        return entry
+
+    def _build_attribution_map(self, result: BookNLPResult) -> _AttributionMaps:
+        """
+        Build maps from normalized quote text → speaker name.
+
+        Returns (exact, loose): keyed by ``_attribution_key`` and by
+        ``_loose_key`` respectively. Every quote is kept, not just those
+        the current unknown utterances ask for: the maps are cached per
+        chapter text across passes, and the fuzzy tier searches all keys.
+        """
+        exact: dict[str, str] = {}
+        loose: dict[str, str] = {}
         for quote in result.quotes:
-            key = quote.quote_text.strip().casefold()[:80]
             if quote.speaker and quote.confidence > 0.3:
-                mapping[key] = quote.speaker
-        return mapping
-
-    def _match_utterance(
+                # Interned so every utterance resolved to this speaker
+                # shares one string object.
+                speaker = sys.intern(quote.speaker)
+                exact[_attribution_key(quote.quote_text)] = speaker
+                loose_key = _loose_key(quote.quote_text)
+                if loose_key:
+                    loose[loose_key] = speaker
+        return exact, loose
+
+    def _match_inexact(
         self,
-        utterance: "Utterance",
-        nlp_attributions: dict[str, str],
+        text: str,
+        text_key: str,
+        nlp_attributions: _AttributionMaps,
     ) -> Optional[str]:
-        """Try to match an utterance's text to an NLP-attributed quote."""
-        text_key = utterance.text.strip().casefold()[:80]
-        return nlp_attributions.get(text_key)
+        """
+        Match utterance text to an NLP-attributed quote after an exact miss.
+
+        ``text_key`` is the text's ``_attribution_key``, already looked up
+        in the exact map by the caller; the loose and fuzzy tiers run here.
+        """
+        exact, loose = nlp_attributions
+        loose_key = _loose_key(text)
+        speaker = loose.get(loose_key) if loose_key else None
+        if speaker or self.fuzzy_threshold is None or not exact:
+            return speaker
+
+        try:
+            from rapidfuzz import fuzz, process
+        except ImportError:
+            return None
+        match = process.extractOne(
+            text_key,
+            exact.keys(),
+            scorer=fuzz.token_set_ratio,
+            score_cutoff=self.fuzzy_threshold,
+        )
+        return exact[match[0]] if match else None
@@ -5,9 +5,25 @@ Supported formats:
 - EPUB (.epub)
 - Plain text (.txt)
 - Markdown (.md)
+
+Parsers are imported on first access, so importing one submodule (e.g.
+``audiobooker.parser.text``) does not pull in the EPUB/HTML stack.
 """
 
-from audiobooker.parser.epub import parse_epub
-from audiobooker.parser.text import parse_text
+import importlib
+
+_LAZY_EXPORTS = {
+    "parse_epub": "audiobooker.parser.epub",
+    "parse_text": "audiobooker.parser.text",
+}
 
 __all__ = ["parse_epub", "parse_text"]
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
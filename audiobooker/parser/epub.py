@@ -6,16 +6,22 @@ Converts HTML content to plain text suitable for TTS.
 """
 
 import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 from html.parser import HTMLParser
-from io import StringIO
 
 from audiobooker.models import Chapter
 
 logger = logging.getLogger("audiobooker.parser")
 
+_NEWLINE_RUN_RE = re.compile(r"\n{3,}")
+
+# Upper bound on threads used to extract EPUB documents
+_MAX_EXTRACT_WORKERS = 8
+
 
 class HTMLTextExtractor(HTMLParser):
     """
@@ -38,7 +44,7 @@ class HTMLTextExtractor(HTMLParser):
 
     def __init__(self):
         super().__init__()
-        self.output = StringIO()
+        self._parts: list[str] = []
         self.skip_depth = 0
         self._pending_newline = False
 
@@ -66,31 +72,114 @@ class HTMLTextExtractor(HTMLParser):
             return
 
         if self._pending_newline:
-            self.output.write("\n\n")
+            self._parts.append("\n\n")
             self._pending_newline = False
 
-        self.output.write(text + " ")
+        self._parts.append(text)
+        self._parts.append(" ")
 
     def get_text(self) -> str:
         """Get extracted text with normalized whitespace."""
-        text = self.output.getvalue()
-        # Normalize multiple newlines
-        text = re.sub(r"\n{3,}", "\n\n", text)
-        # Clean up extra spaces
-        text = re.sub(r" +", " ", text)
-        return text.strip()
+        return _normalize_extracted("".join(self._parts))
+
+
+def _normalize_extracted(text: str) -> str:
+    """Collapse runs of newlines/spaces left by the extractors."""
+    # Chunks are already whitespace-normalized, so these runs are rare;
+    # substring checks skip the work when there is none.
+    # Normalize multiple newlines
+    if "\n\n\n" in text:
+        text = _NEWLINE_RUN_RE.sub("\n\n", text)
+    # Clean up extra spaces
+    while "  " in text:
+        text = text.replace("  ", " ")
+    return text.strip()
+
+
+def _lxml_html_to_text(html_content: str) -> Optional[str]:
+    """
+    Extract text with lxml (libxml2), mirroring HTMLTextExtractor.
+
+    lxml comes with ebooklib, so this is the normal path. Returns None if
+    lxml is unavailable or cannot parse the document, in which case the
+    caller falls back to the pure-Python extractor.
+    """
+    try:
+        from lxml import html as lxml_html
+    except ImportError:
+        return None
+
+    try:
+        # Parse bytes so XHTML with an <?xml encoding=...?> declaration works
+        root = lxml_html.document_fromstring(
+            html_content.encode("utf-8"),
+            parser=lxml_html.HTMLParser(encoding="utf-8"),
+        )
+    except Exception:
+        return None
+
+    block_tags = HTMLTextExtractor.BLOCK_TAGS
+    skip_tags = HTMLTextExtractor.SKIP_TAGS
+    parts: list[str] = []
+    skip_depth = 0
+    pending_newline = False
+
+    def handle_data(data: Optional[str]) -> None:
+        nonlocal pending_newline
+        if not data or skip_depth > 0:
+            return
+        text = " ".join(data.split())
+        if not text:
+            return
+        if pending_newline:
+            parts.append("\n\n")
+            pending_newline = False
+        parts.append(text)
+        parts.append(" ")
+
+    # Iterative document-order walk: (element, closing) pairs. Comments and
+    # processing instructions contribute only their tail text.
+    stack = [(root, False)]
+    while stack:
+        el, closing = stack.pop()
+        tag = el.tag
+        if closing:
+            if tag in skip_tags:
+                skip_depth = max(0, skip_depth - 1)
+            elif tag in block_tags:
+                pending_newline = True
+            handle_data(el.tail)
+            continue
+        if not isinstance(tag, str):
+            handle_data(el.tail)
+            continue
+        if tag in skip_tags:
+            skip_depth += 1
+        elif tag in block_tags:
+            pending_newline = True
+        handle_data(el.text)
+        stack.append((el, True))
+        stack.extend((child, False) for child in reversed(el))
+
+    return _normalize_extracted("".join(parts))
 
 
 def html_to_text(html_content: str) -> str:
     """
     Convert HTML to plain text.
 
+    Uses lxml when available, otherwise the HTMLParser-based extractor.
+
     Args:
         html_content: HTML string
 
     Returns:
         Plain text with paragraph structure preserved
     """
+    text = _lxml_html_to_text(html_content)
+    if text is not None:
+        return text
+
     extractor = HTMLTextExtractor()
     try:
         extractor.feed(html_content)
@@ -102,28 +191,107 @@ def html_to_text(html_content: str) -> str:
     return extractor.get_text()
 
 
+_TITLE_RE = re.compile(
+    r"<h[1-3][^>]*>(?P<h>[^<]+)</h[1-3]>|<title>(?P<t>[^<]+)</title>",
+    re.IGNORECASE,
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _clean_title(raw: Optional[str]) -> Optional[str]:
+    """Normalize a matched title; None if empty or implausibly long."""
+    if raw is None:
+        return None
+    title = _WHITESPACE_RE.sub(" ", raw.strip())
+    if title and len(title) < 200:
+        return title
+    return None
+
+
 def extract_title_from_html(html_content: str) -> Optional[str]:
     """
     Try to extract chapter title from HTML content.
 
-    Looks for h1, h2, h3 tags at the start of content.
+    Looks for h1, h2, h3 tags at the start of content, then <title>.
     """
-    # Look for heading at start
-    patterns = [
-        r"<h[1-3][^>]*>([^<]+)</h[1-3]>",
-        r"<title>([^<]+)</title>",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, html_content[:2000], re.IGNORECASE)
-        if match:
-            title = match.group(1).strip()
-            # Clean up the title
-            title = re.sub(r"\s+", " ", title)
-            if title and len(title) < 200:
+    # One scan of the first 2000 chars; a heading wins over <title> even
+    # when <title> (usually in <head>) comes first.
+    heading_seen = False
+    title_tag = None
+    for match in _TITLE_RE.finditer(html_content, 0, 2000):
+        if match.lastgroup == "h":
+            if heading_seen:
+                continue
+            heading_seen = True
+            title = _clean_title(match.group("h"))
+            if title:
                 return title
+            if title_tag is not None:
+                break
+        elif title_tag is None:
+            title_tag = match.group("t")
+            if heading_seen:
+                break
 
-    return None
+    return _clean_title(title_tag)
+
+
+def _extract_item(item) -> tuple[str, Optional[str]]:
+    """
+    Extract (text, title) from an EPUB document item.
+
+    The item content is decoded once and shared by text and title
+    extraction. Independent per item, so safe to run on worker threads.
+    """
+    content = item.get_content()
+    if isinstance(content, bytes):
+        content = content.decode("utf-8", errors="replace")
+    return html_to_text(content), extract_title_from_html(content)
+
+
+def _extract_items(items: list) -> list[tuple[str, Optional[str]]]:
+    """Extract all items, in order, overlapping work on a thread pool."""
+    workers = min(_MAX_EXTRACT_WORKERS, os.cpu_count() or 1, len(items))
+    if workers <= 1:
+        return [_extract_item(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_extract_item, items))
+
+
+def _chapters_from_items(
+    items: list,
+    min_chapter_words: int,
+    keep_titled_short_chapters: bool,
+) -> list[Chapter]:
+    """Build Chapters from EPUB document items, skipping short sections."""
+    chapters = []
+
+    for item, (text, title) in zip(items, _extract_items(items)):
+        word_count = len(text.split())
+
+        # Skip short sections (unless titled and keep_titled_short_chapters)
+        if word_count < min_chapter_words:
+            if title and keep_titled_short_chapters:
+                logger.info(
+                    f"Keeping short titled section: {title!r} "
+                    f"({word_count} words < {min_chapter_words} threshold)"
+                )
+            else:
+                logger.info(
+                    f"Skipping short section: {title or item.get_name()!r} "
+                    f"({word_count} words < {min_chapter_words} threshold)"
+                )
+                continue
+
+        chapter_index = len(chapters)
+        chapters.append(Chapter(
+            index=chapter_index,
+            title=title or f"Chapter {chapter_index + 1}",
+            raw_text=text,
+            source_file=item.get_name(),
+        ))
+
+    return chapters
 
 
 def parse_epub(
@@ -181,88 +349,23 @@ def parse_epub(
         metadata["language"] = lang_list[0][0]
 
     # Extract chapters from spine (reading order)
-    chapters = []
-    chapter_index = 0
-
-    for item in book.get_items_of_type(ebooklib.ITEM_DOCUMENT):
-        # Get HTML content
-        content = item.get_content()
-        if isinstance(content, bytes):
-            content = content.decode("utf-8", errors="replace")
-
-        # Convert to plain text
-        text = html_to_text(content)
-        word_count = len(text.split())
-
-        # Try to extract title
-        title = extract_title_from_html(item.get_content().decode("utf-8", errors="replace"))
-
-        # Skip short sections (unless titled and keep_titled_short_chapters)
-        if word_count < min_chapter_words:
-            if title and keep_titled_short_chapters:
-                logger.info(
-                    f"Keeping short titled section: {title!r} "
-                    f"({word_count} words < {min_chapter_words} threshold)"
-                )
-            else:
-                logger.info(
-                    f"Skipping short section: {title or item.get_name()!r} "
-                    f"({word_count} words < {min_chapter_words} threshold)"
-                )
-                continue
-
-        if not title:
-            title = f"Chapter {chapter_index + 1}"
-
-        chapter = Chapter(
-            index=chapter_index,
-            title=title,
-            raw_text=text,
-            source_file=item.get_name(),
-        )
-        chapters.append(chapter)
-        chapter_index += 1
+    chapters = _chapters_from_items(
+        list(book.get_items_of_type(ebooklib.ITEM_DOCUMENT)),
+        min_chapter_words,
+        keep_titled_short_chapters,
+    )
 
     # If no chapters found, try spine order
     if not chapters:
+        spine_items = []
         for spine_item in book.spine:
             item_id = spine_item[0] if isinstance(spine_item, tuple) else spine_item
             item = book.get_item_with_id(item_id)
+            if item is not None:
+                spine_items.append(item)
 
-            if item is None:
-                continue
-
-            content = item.get_content()
-            if isinstance(content, bytes):
-                content = content.decode("utf-8", errors="replace")
-
-            text = html_to_text(content)
-            word_count = len(text.split())
-            title = extract_title_from_html(content)
-
-            if word_count < min_chapter_words:
-                if title and keep_titled_short_chapters:
-                    logger.info(
-                        f"Keeping short titled section: {title!r} "
-                        f"({word_count} words < {min_chapter_words} threshold)"
-                    )
-                else:
-                    logger.info(
-                        f"Skipping short section: {title or item.get_name()!r} "
-                        f"({word_count} words < {min_chapter_words} threshold)"
-                    )
-                    continue
-
-            if not title:
-                title = f"Chapter {chapter_index + 1}"
-
-            chapter = Chapter(
-                index=chapter_index,
-                title=title,
-                raw_text=text,
-                source_file=item.get_name(),
-            )
-            chapters.append(chapter)
-            chapter_index += 1
+        chapters = _chapters_from_items(
+            spine_items, min_chapter_words, keep_titled_short_chapters,
+        )
 
     return metadata, chapters
@@ -8,6 +8,8 @@ Chapter heading and scene-break patterns are drawn from a LanguageProfile.
 Default is English.
 """
 
+import mmap
+import os
 import re
 from pathlib import Path
 from typing import Optional
@@ -15,19 +17,9 @@ from typing import Optional
 from audiobooker.models import Chapter
 from audiobooker.language.profile import LanguageProfile, get_profile
 
-
-def _get_chapter_patterns(profile: Optional[LanguageProfile] = None) -> list[str]:
-    """Return chapter patterns from the given profile (default: English)."""
-    if profile is None:
-        profile = get_profile("en")
-    return list(profile.chapter_patterns)
-
-
-def _get_scene_break_patterns(profile: Optional[LanguageProfile] = None) -> list[str]:
-    """Return scene break patterns from the given profile (default: English)."""
-    if profile is None:
-        profile = get_profile("en")
-    return list(profile.scene_break_patterns)
+_FRONTMATTER_END_RE = re.compile(r"\n---\s*\n")
+# "key: value" lines; key is everything before the first colon
+_FRONTMATTER_LINE_RE = re.compile(r"^([^:\n]*):(.*)$", re.MULTILINE)
 
 
 def detect_chapter_pattern(
@@ -40,21 +32,48 @@ def detect_chapter_pattern(
 
     Scans the text and returns the most commonly matching pattern.
     """
-    chapter_patterns = _get_chapter_patterns(profile)
-    pattern_counts = {pattern: 0 for pattern in chapter_patterns}
-
-    for line in text.split("\n")[:200]:  # Check first 200 lines
+    if profile is None:
+        profile = get_profile("en")
+    chapter_patterns = profile.compiled_chapter_patterns
+    scanner = profile.chapter_scanner
+    counts = [0] * len(chapter_patterns)
+    group_names = [f"_c{i}" for i in range(len(chapter_patterns))]
+
+    # Check first 200 lines; maxsplit avoids splitting the whole book
+    lines = text.split("\n", 200)[:200]
+    remaining = len(lines)
+    for line in lines:
+        remaining -= 1
         line = line.strip()
         if not line:
             continue
-        for pattern in chapter_patterns:
-            if re.match(pattern, line, re.MULTILINE):
-                pattern_counts[pattern] += 1
-
-    # Return pattern with most matches (if > 1)
-    best_pattern = max(pattern_counts, key=pattern_counts.get)
-    if pattern_counts[best_pattern] > 1:
-        return re.compile(best_pattern, re.MULTILINE)
+        if scanner is None:
+            for i, pattern in enumerate(chapter_patterns):
+                if pattern.match(line):
+                    counts[i] += 1
+        else:
+            # One pass tells us every pattern this line satisfies
+            m = scanner.match(line)
+            if m.lastindex is None:
+                continue
+            groups = m.groupdict()
+            for i, name in enumerate(group_names):
+                if groups[name] is not None:
+                    counts[i] += 1
+
+        # Stop once the leader can no longer be caught
+        if remaining and len(counts) > 1:
+            first, second = sorted(counts, reverse=True)[:2]
+            if first > second + remaining:
+                break
+
+    # Return pattern with most matches (if > 1); first one wins ties
+    best_index, best_count = -1, 0
+    for i, count in enumerate(counts):
+        if count > best_count:
+            best_index, best_count = i, count
+    if best_count > 1:
+        return chapter_patterns[best_index]
 
     return None
 
@@ -65,8 +84,13 @@ def is_scene_break(
     profile: Optional[LanguageProfile] = None,
 ) -> bool:
     """Check if a line is a scene break (not a chapter break)."""
+    if profile is None:
+        profile = get_profile("en")
     line = line.strip()
-    for pattern in _get_scene_break_patterns(profile):
+    scene_break_re = profile.scene_break_re
+    if scene_break_re is not None:
+        return scene_break_re.match(line) is not None
+    for pattern in profile.scene_break_patterns:
         if re.match(pattern, line):
             return True
     return False
@@ -83,18 +107,14 @@ def extract_frontmatter(text: str) -> tuple[dict, str]:
 
     # Check for YAML frontmatter
     if text.startswith("---"):
-        end_match = re.search(r"\n---\s*\n", text[3:])
+        end_match = _FRONTMATTER_END_RE.search(text, 3)
         if end_match:
-            frontmatter = text[3:end_match.start() + 3]
-            remaining = text[end_match.end() + 3:]
+            frontmatter = text[3:end_match.start()]
+            remaining = text[end_match.end():]
 
-            # Simple YAML parsing (key: value)
-            for line in frontmatter.split("\n"):
-                if ":" in line:
-                    key, value = line.split(":", 1)
-                    key = key.strip().lower()
-                    value = value.strip().strip('"').strip("'")
-                    metadata[key] = value
+            # Simple YAML parsing (key: value), one scan over the block
+            for key, value in _FRONTMATTER_LINE_RE.findall(frontmatter):
+                metadata[key.strip().lower()] = value.strip().strip('"').strip("'")
 
             return metadata, remaining
 
@@ -118,6 +138,9 @@ def split_into_chapters(
     Returns:
         List of (title, content) tuples
     """
+    if profile is None:
+        profile = get_profile("en")
+
     if delimiter_pattern:
         pattern = re.compile(delimiter_pattern, re.MULTILINE)
     else:
@@ -128,21 +151,27 @@ def split_into_chapters(
         return [("Chapter 1", text)]
 
     chapters = []
-    lines = text.split("\n")
     current_title = None
-    current_content = []
+    body_start = 0  # Offset where the current chapter's content begins
+    line_start = 0
+    text_len = len(text)
+
+    # Walk line offsets instead of materializing text.split("\n"); chapter
+    # bodies are sliced straight out of text.
+    while line_start <= text_len:
+        line_end = text.find("\n", line_start)
+        if line_end < 0:
+            line_end = text_len
+        stripped = text[line_start:line_end].strip()
 
-    for line in lines:
         # Check if this line is a chapter delimiter
-        match = pattern.match(line.strip())
+        match = pattern.match(stripped)
 
         if match:
-            # Save previous chapter if exists
-            if current_title is not None or current_content:
-                title = current_title or "Untitled"
-                content = "\n".join(current_content).strip()
-                if content:
-                    chapters.append((title, content))
+            # Save previous chapter if it has content
+            content = text[body_start:max(body_start, line_start - 1)].strip()
+            if content:
+                chapters.append((current_title or "Untitled", content))
 
             # Start new chapter
             groups = match.groups()
@@ -150,25 +179,41 @@ def split_into_chapters(
                 # Pattern has chapter number and title
                 current_title = f"Chapter {groups[0]}: {groups[1]}"
             elif len(groups) >= 1:
-                current_title = groups[0] if groups[0] else line.strip()
+                current_title = groups[0] if groups[0] else stripped
             else:
-                current_title = line.strip()
+                current_title = stripped
 
-            current_content = []
-        else:
-            # Add to current chapter
-            current_content.append(line)
+            body_start = line_end + 1
+
+        line_start = line_end + 1
 
     # Don't forget the last chapter
-    if current_title is not None or current_content:
-        title = current_title or "Untitled"
-        content = "\n".join(current_content).strip()
-        if content:
-            chapters.append((title, content))
+    content = text[body_start:].strip()
+    if content:
+        chapters.append((current_title or "Untitled", content))
 
     return chapters
 
 
+def _read_text_file(path: Path) -> str:
+    """
+    Read a UTF-8 text file with universal newlines.
+
+    Decodes straight from a memory map, skipping the intermediate bytes
+    copy and chunked decoding of a text-mode read(). Same result as
+    ``open(path, encoding="utf-8").read()``.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, "utf-8")
+
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
 def parse_text(
     path: Path,
     chapter_delimiter: Optional[str] = None,
@@ -191,8 +236,7 @@ def parse_text(
         raise FileNotFoundError(f"Text file not found: {path}")
 
     # Read file
-    with open(path, "r", encoding="utf-8") as f:
-        text = f.read()
+    text = _read_text_file(path)
 
     # Extract frontmatter if present
     metadata, text = extract_frontmatter(text)
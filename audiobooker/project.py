@@ -12,12 +12,12 @@ Manages the full lifecycle:
 Project state is persisted to JSON for resumption.
 """
 
-import json
 from dataclasses import dataclass, field
-from datetime import datetime
 from pathlib import Path
 from typing import Optional, Callable
 
+from audiobooker import _json
+from audiobooker._timestamps import now_iso
 from audiobooker.models import (
     Chapter,
     Utterance,
@@ -25,11 +25,19 @@ from audiobooker.models import (
     CastingTable,
     ProjectConfig,
 )
+# Light, dependency-free modules used on every compile; heavier or optional
+# ones (parsers, NLP, renderer, review) stay imported on first use.
+from audiobooker.casting.dialogue import compile_chapter, tally_line_counts
+from audiobooker.language.profile import LanguageProfile, get_profile
 
 
 # Project file schema version for forward compatibility
 SCHEMA_VERSION = 1
 
+# Fewer chapters than this compile serially even with compile_workers > 1;
+# process startup would cost more than it saves.
+_MIN_PARALLEL_CHAPTERS = 4
+
 
 @dataclass
 class RenderProgress:
@@ -42,6 +50,32 @@ class RenderProgress:
     error_message: Optional[str] = None
 
 
+# Set once per compile worker process by _init_compile_worker
+_worker_casting: Optional[CastingTable] = None
+_worker_profile: Optional[LanguageProfile] = None
+
+
+def _init_compile_worker(casting: CastingTable, profile: LanguageProfile) -> None:
+    """Process-pool initializer: receive the casting table and profile once."""
+    global _worker_casting, _worker_profile
+    _worker_casting = casting
+    _worker_profile = profile
+
+
+def _compile_chapter_job(chapter: Chapter) -> list[Utterance]:
+    """Process-pool entry point for AudiobookProject.compile."""
+    return compile_chapter(chapter, _worker_casting, profile=_worker_profile)
+
+
+@dataclass
+class ProjectStats:
+    """Chapter-derived totals gathered in one pass (see AudiobookProject._stats)."""
+    words: int = 0
+    all_compiled: bool = True
+    all_rendered: bool = True
+    speakers: set[str] = field(default_factory=set)
+
+
 @dataclass
 class AudiobookProject:
     """
@@ -67,8 +101,8 @@ class AudiobookProject:
     author: str = ""
     source_path: Optional[Path] = None
     project_path: Optional[Path] = None
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    modified_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=now_iso)
+    modified_at: str = field(default_factory=now_iso)
 
     # Content
     chapters: list[Chapter] = field(default_factory=list)
@@ -146,7 +180,6 @@ class AudiobookProject:
             Initialized AudiobookProject
         """
         from audiobooker.parser.text import parse_text
-        from audiobooker.language.profile import get_profile
 
         path = Path(path)
         if not path.exists():
@@ -193,7 +226,6 @@ class AudiobookProject:
             Initialized AudiobookProject.
         """
         from audiobooker.parser.text import split_into_chapters, extract_frontmatter
-        from audiobooker.language.profile import get_profile
 
         config = kwargs.pop("config", ProjectConfig(language_code=lang))
         config.language_code = lang
@@ -274,8 +306,7 @@ class AudiobookProject:
         if not path.exists():
             raise FileNotFoundError(f"Project file not found: {path}")
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _json.loads(path.read_bytes())
 
         # Check schema version
         schema_version = data.get("schema_version", 1)
@@ -290,8 +321,8 @@ class AudiobookProject:
             author=data.get("author", ""),
             source_path=Path(data["source_path"]) if data.get("source_path") else None,
             project_path=path,
-            created_at=data.get("created_at", datetime.now().isoformat()),
-            modified_at=data.get("modified_at", datetime.now().isoformat()),
+            created_at=data.get("created_at", now_iso()),
+            modified_at=data.get("modified_at", now_iso()),
             output_path=Path(data["output_path"]) if data.get("output_path") else None,
         )
 
@@ -336,7 +367,7 @@ class AudiobookProject:
 
         path = Path(path)
         self.project_path = path
-        self.modified_at = datetime.now().isoformat()
+        self.modified_at = now_iso()
 
         data = {
             "schema_version": SCHEMA_VERSION,
@@ -351,8 +382,7 @@ class AudiobookProject:
             "config": self.config.to_dict(),
         }
 
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        path.write_bytes(_json.dumps_bytes(data))
 
         return path
 
@@ -392,11 +422,7 @@ class AudiobookProject:
         Returns:
             Set of speaker names found in utterances
         """
-        speakers = set()
-        for chapter in self.chapters:
-            for utterance in chapter.utterances:
-                speakers.add(utterance.speaker)
-        return speakers
+        return set().union(*(chapter.speakers for chapter in self.chapters))
 
     def get_uncast_speakers(self) -> set[str]:
         """
@@ -406,8 +432,7 @@ class AudiobookProject:
             Set of uncast speaker names (canonical keys)
         """
         detected = {self.casting.normalize_key(s) for s in self.get_detected_speakers()}
-        cast = set(self.casting.characters.keys())
-        return detected - cast
+        return detected - self.casting.characters.keys()
 
     def _validate_voices(self) -> None:
         """
@@ -444,22 +469,24 @@ class AudiobookProject:
         Args:
             progress_callback: Callback(current, total, chapter_title)
         """
-        from audiobooker.casting.dialogue import compile_chapter
-        from audiobooker.language.profile import get_profile
 
         profile = get_profile(self.config.language_code)
 
         self.progress.status = "compiling"
         self.progress.total_chapters = len(self.chapters)
 
-        for i, chapter in enumerate(self.chapters):
-            self.progress.current_chapter = i + 1
-            if progress_callback:
-                progress_callback(i + 1, len(self.chapters), chapter.title)
+        workers = self.config.compile_workers
+        if workers > 1 and len(self.chapters) >= _MIN_PARALLEL_CHAPTERS:
+            self._compile_parallel(workers, profile, progress_callback)
+        else:
+            for i, chapter in enumerate(self.chapters):
+                self.progress.current_chapter = i + 1
+                if progress_callback:
+                    progress_callback(i + 1, len(self.chapters), chapter.title)
 
-            # Compile chapter to utterances
-            utterances = compile_chapter(chapter, self.casting, profile=profile)
-            chapter.utterances = utterances
+                # Compile chapter to utterances
+                utterances = compile_chapter(chapter, self.casting, profile=profile)
+                chapter.utterances = utterances
 
         # Optional NLP speaker resolution (BookNLP)
         if self.config.booknlp_mode != "off":
@@ -479,7 +506,44 @@ class AudiobookProject:
                 inferencer.apply_to_utterances(chapter.utterances, chapter.raw_text)
 
         self.progress.status = "idle"
-        self.modified_at = datetime.now().isoformat()
+        self.modified_at = now_iso()
+
+    def _compile_parallel(
+        self,
+        workers: int,
+        profile: LanguageProfile,
+        progress_callback: Optional[Callable[[int, int, str], None]],
+    ) -> None:
+        """
+        Compile chapters in worker processes, assigning results in order.
+
+        The casting table and profile are sent once per worker process
+        (pool initializer), not once per chapter. Workers compile against
+        that copy of the casting table, so line counts are tallied here on
+        the real one.
+        """
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        total = len(self.chapters)
+        # Only the fields compile_chapter reads, not existing utterances
+        jobs = [Chapter(index=c.index, title=c.title, raw_text=c.raw_text) for c in self.chapters]
+        max_workers = min(workers, total)
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_compile_worker,
+            initargs=(self.casting, profile),
+        ) as pool:
+            # A few chunks per worker: fewer round trips, still balanced
+            chunksize = max(1, total // (max_workers * 4))
+            results = pool.map(_compile_chapter_job, jobs, chunksize=chunksize)
+            for i, (chapter, utterances) in enumerate(zip(self.chapters, results)):
+                self.progress.current_chapter = i + 1
+                if progress_callback:
+                    progress_callback(i + 1, total, chapter.title)
+                chapter.utterances = utterances
+                tally_line_counts(utterances, self.casting)
 
     def compile_chapter(self, chapter_index: int) -> list[Utterance]:
         """
@@ -491,8 +555,6 @@ class AudiobookProject:
         Returns:
             List of Utterances
         """
-        from audiobooker.casting.dialogue import compile_chapter
-        from audiobooker.language.profile import get_profile
 
         profile = get_profile(self.config.language_code)
 
@@ -564,7 +626,7 @@ class AudiobookProject:
         )
 
         self.progress.status = "complete"
-        self.modified_at = datetime.now().isoformat()
+        self.modified_at = now_iso()
 
         return result_path
 
@@ -657,7 +719,7 @@ class AudiobookProject:
         review_path = Path(review_path)
         stats = import_reviewed(self, review_path)
 
-        self.modified_at = datetime.now().isoformat()
+        self.modified_at = now_iso()
         return stats
 
     def preview_review_format(self, chapter_index: int = 0) -> str:
@@ -678,6 +740,23 @@ class AudiobookProject:
     # Info & Stats
     # -------------------------------------------------------------------------
 
+    def _stats(self) -> ProjectStats:
+        """Gather info() totals in a single traversal of the chapters."""
+        stats = ProjectStats()
+        words = 0
+        speakers = stats.speakers
+        for chapter in self.chapters:
+            words += chapter.word_count
+            if chapter.utterances:
+                speakers.update(u.speaker for u in chapter.utterances)
+            else:
+                stats.all_compiled = False
+            # is_rendered stats the file; stop checking once one is missing
+            if stats.all_rendered and not chapter.is_rendered:
+                stats.all_rendered = False
+        stats.words = words
+        return stats
+
     @property
     def total_words(self) -> int:
         """Total word count across all chapters."""
@@ -700,17 +779,20 @@ class AudiobookProject:
         Returns:
             Dict with project stats
         """
+        stats = self._stats()
+        normalize_key = self.casting.normalize_key
+        uncast = {normalize_key(s) for s in stats.speakers} - self.casting.characters.keys()
         return {
             "title": self.title,
             "author": self.author,
             "source": str(self.source_path) if self.source_path else None,
             "chapters": len(self.chapters),
-            "total_words": self.total_words,
-            "estimated_duration_minutes": round(self.estimated_duration_minutes, 1),
+            "total_words": stats.words,
+            "estimated_duration_minutes": round(stats.words / self.config.estimated_wpm, 1),
             "characters_cast": len(self.casting.characters),
-            "uncast_speakers": list(self.get_uncast_speakers()),
-            "compiled": all(c.is_compiled for c in self.chapters),
-            "rendered": all(c.is_rendered for c in self.chapters),
+            "uncast_speakers": list(uncast),
+            "compiled": stats.all_compiled,
+            "rendered": stats.all_rendered,
             "output": str(self.output_path) if self.output_path else None,
         }
 
@@ -2,7 +2,10 @@
 Render cache manifest — tracks per-chapter WAV status for resume.
 
 The manifest is the source-of-truth for what has been rendered.
-It is atomically written after each chapter completes.
+After each chapter completes, its entry is appended to an NDJSON journal
+next to the manifest; the full snapshot is rewritten (and the journal
+cleared) periodically and at the end of a render. Loading replays the
+journal on top of the snapshot.
 """
 
 from __future__ import annotations
@@ -10,20 +13,34 @@ from __future__ import annotations
 import json
 import logging
 import os
-from dataclasses import dataclass, field, asdict
-from datetime import datetime, timezone
+from dataclasses import dataclass, field
+from datetime import timezone
 from pathlib import Path
 from typing import Optional
 
+from audiobooker import _json
+from audiobooker._timestamps import now_iso
+
 logger = logging.getLogger("audiobooker.cache")
 
 MANIFEST_VERSION = 1
 MANIFEST_FILENAME = "render_v1.json"
+JOURNAL_SUFFIX = ".journal"
 
 
-@dataclass
+def utc_now_iso() -> str:
+    """UTC ISO-8601 timestamp, second resolution."""
+    return now_iso(timezone.utc)
+
+
+@dataclass(slots=True)
 class ChapterCacheEntry:
-    """One chapter's cache record."""
+    """
+    One chapter's cache record.
+
+    ``wav_path`` is the WAV's file name inside ``<cache_root>/chapters/``.
+    Absolute paths (written by older versions) are still honoured.
+    """
     chapter_index: int
     text_hash: str
     casting_hash: str
@@ -34,8 +51,21 @@ class ChapterCacheEntry:
     error_summary: str = ""
     created_at: str = ""
 
-    def is_valid(self, text_hash: str, casting_hash: str, render_params_hash: str) -> bool:
-        """Check if this entry is still valid (hashes match and WAV exists)."""
+    def is_valid(
+        self,
+        text_hash: str,
+        casting_hash: str,
+        render_params_hash: str,
+        present: Optional[set[str]] = None,
+        cache_root: Optional[Path] = None,
+    ) -> bool:
+        """
+        Check if this entry is still valid (hashes match and WAV exists).
+
+        ``present`` is an optional set of WAV names known to exist (see
+        present_wavs); a WAV listed there is not stat()ed again.
+        ``cache_root`` resolves relative wav_path values.
+        """
         if self.status != "ok":
             return False
         if self.text_hash != text_hash:
@@ -44,45 +74,135 @@ class ChapterCacheEntry:
             return False
         if self.render_params_hash != render_params_hash:
             return False
-        if not Path(self.wav_path).exists():
+        if present is not None and self.wav_path in present:
+            return True
+        if not self.resolve_wav_path(cache_root).exists():
             return False
         return True
 
+    def resolve_wav_path(self, cache_root: Optional[Path] = None) -> Path:
+        """Full path of this entry's WAV (relative names need cache_root)."""
+        if cache_root is None or os.path.isabs(self.wav_path):
+            return Path(self.wav_path)
+        return get_chapters_dir(cache_root) / self.wav_path
+
+    def to_dict(self) -> dict:
+        """Serialize to dictionary."""
+        return {
+            "chapter_index": self.chapter_index,
+            "text_hash": self.text_hash,
+            "casting_hash": self.casting_hash,
+            "render_params_hash": self.render_params_hash,
+            "wav_path": self.wav_path,
+            "duration_s": self.duration_s,
+            "status": self.status,
+            "error_summary": self.error_summary,
+            "created_at": self.created_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ChapterCacheEntry":
+        """Deserialize, reducing legacy absolute wav paths to their name."""
+        entry = cls(**data)
+        if os.path.isabs(entry.wav_path):
+            entry.wav_path = os.path.basename(entry.wav_path)
+        return entry
+
 
 @dataclass
 class CacheManifest:
-    """Top-level manifest for a render session."""
+    """
+    Top-level manifest for a render session.
+
+    Entries are looked up through an index on chapter_index, and by
+    status through per-status position sets. Update them with
+    set_entry(); appending to ``chapters`` directly is also detected.
+    """
     version: int = MANIFEST_VERSION
     book_title: str = ""
     config_hash: str = ""
     chapters: list[ChapterCacheEntry] = field(default_factory=list)
     last_updated: str = ""
+    # chapter_index -> position in chapters, status -> positions, and how
+    # many list entries they cover (not serialized)
+    _index: dict[int, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False,
+    )
+    _by_status: dict[str, set[int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False,
+    )
+    _indexed_len: int = field(default=0, init=False, repr=False, compare=False)
+
+    def _reindex(self) -> None:
+        """Rebuild both indexes from ``chapters``."""
+        index: dict[int, int] = {}
+        by_status: dict[str, set[int]] = {}
+        for i, entry in enumerate(self.chapters):
+            # Earliest entry wins, matching a front-to-back scan
+            index.setdefault(entry.chapter_index, i)
+            by_status.setdefault(entry.status, set()).add(i)
+        self._index = index
+        self._by_status = by_status
+        self._indexed_len = len(self.chapters)
+
+    def _position(self, chapter_index: int) -> Optional[int]:
+        """List position of a chapter's entry, via the index."""
+        chapters = self.chapters
+        pos = self._index.get(chapter_index)
+        if pos is not None:
+            if pos < len(chapters) and chapters[pos].chapter_index == chapter_index:
+                return pos
+        elif self._indexed_len == len(chapters):
+            return None
+        # Index stale (chapters edited directly): rebuild
+        self._reindex()
+        return self._index.get(chapter_index)
 
     def get_entry(self, chapter_index: int) -> Optional[ChapterCacheEntry]:
         """Find entry by chapter index."""
-        for entry in self.chapters:
-            if entry.chapter_index == chapter_index:
-                return entry
-        return None
+        pos = self._position(chapter_index)
+        return self.chapters[pos] if pos is not None else None
 
     def set_entry(self, entry: ChapterCacheEntry) -> None:
         """Insert or replace entry for a chapter index."""
-        for i, existing in enumerate(self.chapters):
-            if existing.chapter_index == entry.chapter_index:
-                self.chapters[i] = entry
-                return
-        self.chapters.append(entry)
+        pos = self._position(entry.chapter_index)
+        if pos is not None:
+            old = self.chapters[pos]
+            self._by_status.get(old.status, set()).discard(pos)
+            self.chapters[pos] = entry
+        else:
+            pos = len(self.chapters)
+            self._index[entry.chapter_index] = pos
+            self.chapters.append(entry)
+            self._indexed_len = len(self.chapters)
+        self._by_status.setdefault(entry.status, set()).add(pos)
+
+    def _with_status(self, status: str) -> list[ChapterCacheEntry]:
+        """Entries with the given status, in list order."""
+        if self._indexed_len != len(self.chapters):
+            self._reindex()
+        chapters = self.chapters
+        return [
+            chapters[i] for i in sorted(self._by_status.get(status, ()))
+            if chapters[i].status == status
+        ]
 
     def ok_chapters(self) -> list[ChapterCacheEntry]:
         """Return entries with status='ok'."""
-        return [e for e in self.chapters if e.status == "ok"]
+        return self._with_status("ok")
 
     def failed_chapters(self) -> list[ChapterCacheEntry]:
         """Return entries with status='failed'."""
-        return [e for e in self.chapters if e.status == "failed"]
+        return self._with_status("failed")
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            "version": self.version,
+            "book_title": self.book_title,
+            "config_hash": self.config_hash,
+            "chapters": [e.to_dict() for e in self.chapters],
+            "last_updated": self.last_updated,
+        }
 
     def to_json(self) -> str:
         return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
@@ -90,7 +210,7 @@ class CacheManifest:
     @classmethod
     def from_dict(cls, data: dict) -> "CacheManifest":
         chapters = [
-            ChapterCacheEntry(**ch) for ch in data.get("chapters", [])
+            ChapterCacheEntry.from_dict(ch) for ch in data.get("chapters", [])
         ]
         return cls(
             version=data.get("version", MANIFEST_VERSION),
@@ -105,36 +225,79 @@ class CacheManifest:
 # Atomic I/O
 # ---------------------------------------------------------------------------
 
+def get_journal_path(manifest_path: Path) -> Path:
+    """Journal file that accompanies a manifest snapshot."""
+    return manifest_path.with_suffix(JOURNAL_SUFFIX)
+
+
+def _replay_journal(manifest: CacheManifest, journal_path: Path) -> int:
+    """Apply journaled entries to manifest. Returns the number applied."""
+    applied = 0
+    with open(journal_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                manifest.set_entry(ChapterCacheEntry.from_dict(json.loads(line)))
+            except (json.JSONDecodeError, TypeError) as e:
+                # A torn final write after a crash; earlier entries stand
+                logger.warning(f"Stopping journal replay at bad line in {journal_path}: {e}")
+                break
+            applied += 1
+    return applied
+
+
 def load_manifest(manifest_path: Path) -> Optional[CacheManifest]:
-    """Load manifest from disk. Returns None if missing or corrupt."""
-    if not manifest_path.exists():
+    """Load manifest (snapshot + journal) from disk. None if missing or corrupt."""
+    journal_path = get_journal_path(manifest_path)
+    has_journal = journal_path.exists()
+    if not manifest_path.exists() and not has_journal:
         return None
     try:
-        data = json.loads(manifest_path.read_text(encoding="utf-8"))
-        manifest = CacheManifest.from_dict(data)
+        if manifest_path.exists():
+            manifest = CacheManifest.from_dict(_json.loads(manifest_path.read_bytes()))
+        else:
+            manifest = CacheManifest()
         if manifest.version > MANIFEST_VERSION:
             logger.warning(
                 f"Manifest version {manifest.version} > supported {MANIFEST_VERSION}; ignoring cache"
             )
             return None
+        if has_journal:
+            _replay_journal(manifest, journal_path)
         return manifest
     except (json.JSONDecodeError, KeyError, TypeError) as e:
         logger.warning(f"Corrupt manifest at {manifest_path}: {e}")
         return None
 
 
+def append_entry(entry: ChapterCacheEntry, manifest_path: Path) -> None:
+    """Durably append one chapter entry to the manifest's journal."""
+    journal_path = get_journal_path(manifest_path)
+    journal_path.parent.mkdir(parents=True, exist_ok=True)
+    line = json.dumps(entry.to_dict(), ensure_ascii=False) + "\n"
+    with open(journal_path, "a", encoding="utf-8") as f:
+        f.write(line)
+        f.flush()
+        os.fsync(f.fileno())
+
+
 def save_manifest(manifest: CacheManifest, manifest_path: Path) -> None:
-    """Atomically write manifest (write tmp → rename)."""
-    manifest.last_updated = datetime.now(timezone.utc).isoformat()
+    """Atomically write the full manifest (write + fsync tmp → replace), then clear the journal."""
+    manifest.last_updated = utc_now_iso()
     manifest_path.parent.mkdir(parents=True, exist_ok=True)
 
     tmp_path = manifest_path.with_suffix(".json.tmp")
-    tmp_path.write_text(manifest.to_json(), encoding="utf-8")
+    with open(tmp_path, "wb") as f:
+        f.write(manifest.to_json().encode("utf-8"))
+        f.flush()
+        os.fsync(f.fileno())
+
+    # Atomic on POSIX and Windows: readers see the old or new file, never none
+    os.replace(tmp_path, manifest_path)
 
-    # Atomic rename (on Windows, must remove target first)
-    if manifest_path.exists():
-        manifest_path.unlink()
-    os.rename(str(tmp_path), str(manifest_path))
+    # The snapshot now includes every journaled entry
+    get_journal_path(manifest_path).unlink(missing_ok=True)
 
 
 # ---------------------------------------------------------------------------
@@ -155,8 +318,56 @@ def get_manifests_dir(cache_root: Path) -> Path:
 
 
 def get_chapter_wav_path(cache_root: Path, chapter_index: int) -> Path:
+    """Index-named WAV path (layout used before content addressing)."""
     return get_chapters_dir(cache_root) / f"chapter_{chapter_index:04d}.wav"
 
 
+def get_content_wav_path(
+    cache_root: Path,
+    text_hash: str,
+    utterances_hash: str,
+    casting_hash: str,
+    render_params_hash: str,
+) -> Path:
+    """
+    Content-addressed WAV path: identical audio inputs share one file.
+
+    Chapters with the same text, compiled script, casting and render
+    params (repeated boilerplate, or a chapter whose index shifted) reuse
+    the same WAV.
+    """
+    name = (
+        f"{text_hash[:16]}_{utterances_hash[:16]}_"
+        f"{casting_hash[:8]}_{render_params_hash[:8]}.wav"
+    )
+    return get_chapters_dir(cache_root) / name
+
+
+def remove_unreferenced_wavs(cache_root: Path, keep: set[str]) -> int:
+    """Delete chapter WAVs whose names are not in ``keep``. Returns count removed."""
+    removed = 0
+    try:
+        with os.scandir(get_chapters_dir(cache_root)) as it:
+            stale = [e.path for e in it if e.name.endswith(".wav") and e.name not in keep]
+    except FileNotFoundError:
+        return 0
+    for path in stale:
+        try:
+            os.unlink(path)
+            removed += 1
+        except OSError as e:
+            logger.warning(f"Could not remove stale cache WAV {path}: {e}")
+    return removed
+
+
 def get_manifest_path(cache_root: Path) -> Path:
     return get_manifests_dir(cache_root) / MANIFEST_FILENAME
+
+
+def present_wavs(cache_root: Path) -> set[str]:
+    """Names of the chapter WAVs currently in the cache, from one directory scan."""
+    try:
+        with os.scandir(get_chapters_dir(cache_root)) as it:
+            return {e.name for e in it if e.name.endswith(".wav")}
+    except FileNotFoundError:
+        return set()
@@ -10,9 +10,11 @@ Supports persistent chapter cache with manifest-driven resume.
 import json
 import logging
 import os
+import queue
 import time
-from dataclasses import dataclass, asdict
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Callable, TYPE_CHECKING
 
@@ -25,12 +27,18 @@ if TYPE_CHECKING:
 # Structured logger for render operations
 logger = logging.getLogger("audiobooker.renderer")
 
+# Chapter updates journaled between full manifest rewrites during a render
+_MANIFEST_COMPACT_EVERY = 50
+
+# Minimum seconds between per-utterance progress callbacks within a chapter
+_PROGRESS_MIN_INTERVAL_S = 0.05
+
 
 # ---------------------------------------------------------------------------
 # Structured logging
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class RenderLog:
     """Structured log entry for chapter rendering."""
     chapter_index: int
@@ -47,14 +55,34 @@ class RenderLog:
     error_speaker: str = ""
     error_text_preview: str = ""
 
+    def to_dict(self) -> dict:
+        """Flat field dict (asdict's recursive copying is wasted on scalars)."""
+        return {
+            "chapter_index": self.chapter_index,
+            "chapter_title": self.chapter_title,
+            "utterance_count": self.utterance_count,
+            "total_chars": self.total_chars,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration_seconds": self.duration_seconds,
+            "output_path": self.output_path,
+            "status": self.status,
+            "error_message": self.error_message,
+            "error_utterance_index": self.error_utterance_index,
+            "error_speaker": self.error_speaker,
+            "error_text_preview": self.error_text_preview,
+        }
+
     def to_json(self) -> str:
-        return json.dumps(asdict(self), ensure_ascii=False)
+        return json.dumps(self.to_dict(), ensure_ascii=False)
 
     def log(self):
+        # Only serialize when the record will actually be emitted
         if self.status == "error":
-            logger.error(f"RENDER_FAIL: {self.to_json()}")
-        else:
-            logger.info(f"RENDER_OK: {self.to_json()}")
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error("RENDER_FAIL: %s", self.to_json())
+        elif logger.isEnabledFor(logging.INFO):
+            logger.info("RENDER_OK: %s", self.to_json())
 
 
 # ---------------------------------------------------------------------------
@@ -94,8 +122,15 @@ class _VoiceSoundboardEngine:
         )
 
 
+@lru_cache(maxsize=1)
 def get_default_engine() -> TTSEngine:
-    """Create the real voice-soundboard TTS engine (lazy)."""
+    """
+    Return the process-wide voice-soundboard TTS engine (lazy).
+
+    Loading the model is the expensive part of a cold render, so it
+    happens once per process. Use get_default_engine.cache_clear() to
+    force a reload.
+    """
     return _VoiceSoundboardEngine()
 
 
@@ -119,7 +154,9 @@ def render_chapter(
         casting: CastingTable for voice mapping.
         output_path: Output audio file path.
         progress_callback: Callback(current_utterance, total_utterances).
-        engine: Injected TTSEngine (defaults to voice-soundboard).
+        engine: Injected TTSEngine (defaults to voice-soundboard). With
+            config.render_workers > 1 it is called from several threads
+            at once and must be thread-safe.
 
     Returns:
         Path to rendered audio file.
@@ -150,10 +187,17 @@ def render_chapter(
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
+        last_emit = 0.0
+
         def internal_progress(current: int, total: int, speaker: str = ""):
-            nonlocal current_utterance_idx
+            nonlocal current_utterance_idx, last_emit
             current_utterance_idx = current - 1
             if progress_callback:
+                # Per-utterance updates are throttled; the final one always fires
+                now = time.monotonic()
+                if current < total and now - last_emit < _PROGRESS_MIN_INTERVAL_S:
+                    return
+                last_emit = now
                 progress_callback(current, total)
 
         result = engine.synthesize(
@@ -193,7 +237,7 @@ def render_chapter(
 # Render summary (returned to caller for user-facing messages)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class RenderSummary:
     """Result of render_project with per-chapter accounting."""
     output_path: Path
@@ -203,11 +247,7 @@ class RenderSummary:
     total: int = 0
     cache_dir: str = ""
     manifest_path: str = ""
-    failed_chapters: list[dict] = None  # type: ignore[assignment]
-
-    def __post_init__(self):
-        if self.failed_chapters is None:
-            self.failed_chapters = []
+    failed_chapters: list[dict] = field(default_factory=list)
 
 
 # ---------------------------------------------------------------------------
@@ -230,13 +270,17 @@ def render_project(
     Render all chapters and assemble final audiobook.
 
     Chapter WAVs are persisted to a stable cache directory so that
-    failures are non-catastrophic and reruns skip completed work.
+    failures are non-catastrophic and reruns skip completed work. WAVs
+    are content-addressed, so a chapter whose audio inputs match an
+    already-rendered one (e.g. after chapters are inserted) reuses it.
 
     Args:
         project: AudiobookProject to render.
         output_path: Output file path (.m4b or .mp3).
         progress_callback: Callback(current_chapter, total_chapters, status).
-        engine: Injected TTSEngine (defaults to voice-soundboard).
+        engine: Injected TTSEngine (defaults to voice-soundboard). With
+            config.render_workers > 1 it is called from several threads
+            at once and must be thread-safe.
         assembler: Injected assembly function (defaults to assemble_m4b).
         cache_root: Override cache directory (default: derive from project).
         resume: If True, skip chapters whose cache entries are still valid.
@@ -249,11 +293,12 @@ def render_project(
     from audiobooker.renderer.output import assemble_m4b as _default_assembler
     from audiobooker.renderer.cache_manifest import (
         CacheManifest, ChapterCacheEntry,
-        load_manifest, save_manifest,
-        get_cache_root, get_chapter_wav_path, get_manifest_path,
+        load_manifest, save_manifest, append_entry, utc_now_iso,
+        get_cache_root, get_content_wav_path, get_manifest_path, present_wavs,
+        get_chapters_dir, remove_unreferenced_wavs,
     )
     from audiobooker.renderer.hash_utils import (
-        chapter_text_hash, casting_hash, render_params_hash,
+        chapter_text_hash, casting_hash, render_params_hash, utterances_hash,
     )
     from audiobooker.renderer.progress import RenderProgressTracker
     from audiobooker.renderer.failure_report import RenderFailureReport
@@ -290,6 +335,27 @@ def render_project(
     (cache_root / "chapters").mkdir(exist_ok=True)
     (cache_root / "manifests").mkdir(exist_ok=True)
 
+    # Start from a clean snapshot: folds a resumed journal in, or resets
+    # the cache record for a fresh render. Per-chapter updates are then
+    # journaled, with periodic compaction.
+    save_manifest(manifest, manifest_path)
+    journaled = 0
+
+    # One directory scan instead of a stat() per cached chapter
+    cached_wavs = present_wavs(cache_root) if resume else set()
+    # Rendered WAV name -> an ok entry for it, for reuse across chapters
+    reusable = {e.wav_path: e for e in manifest.ok_chapters()} if resume else {}
+
+    def record(entry: ChapterCacheEntry) -> None:
+        nonlocal journaled
+        manifest.set_entry(entry)
+        journaled += 1
+        if journaled >= _MANIFEST_COMPACT_EVERY:
+            save_manifest(manifest, manifest_path)
+            journaled = 0
+        else:
+            append_entry(entry, manifest_path)
+
     summary = RenderSummary(
         output_path=output_path,
         total=len(project.chapters),
@@ -306,12 +372,135 @@ def render_project(
         manifest_path=str(manifest_path),
     )
 
+    workers = max(1, project.config.render_workers)
+    total = len(project.chapters)
+
+    def mark_reused(
+        i: int, chapter: "Chapter", target_path: Path,
+        duration_s: float, text_hash: str,
+    ) -> None:
+        chapter.audio_path = target_path
+        chapter.duration_seconds = duration_s
+        record(ChapterCacheEntry(
+            chapter_index=i,
+            text_hash=text_hash,
+            casting_hash=current_casting_hash,
+            render_params_hash=current_params_hash,
+            wav_path=target_path.name,
+            duration_s=duration_s,
+            status="ok",
+            created_at=utc_now_iso(),
+        ))
+        tracker.mark_cached(i, chapter.title, duration_s)
+        logger.info(
+            f"RENDER_CACHE_HIT: chapter={i} title={chapter.title!r} "
+            f"reused={target_path.name}"
+        )
+        summary.skipped_cached += 1
+
+        if progress_callback:
+            status = tracker.format_chapter_status(i, f"Cached: {chapter.title}")
+            progress_callback(i + 1, total, status)
+
+    def start_render(i: int, chapter: "Chapter") -> None:
+        tracker.start_chapter(i, chapter.title, word_count=chapter.word_count)
+
+        if progress_callback:
+            status = tracker.format_chapter_status(i, f"Rendering: {chapter.title}")
+            progress_callback(i + 1, total, status)
+
+    def finish_ok(
+        i: int, chapter: "Chapter", target_path: Path, tmp_path: Path,
+        text_hash: str, elapsed: float,
+    ) -> None:
+        # Atomic rename: tmp → final (overwrites on POSIX and Windows)
+        os.replace(tmp_path, target_path)
+
+        # Update chapter to point at cached path
+        chapter.audio_path = target_path
+        # duration_seconds is set by render_chapter
+
+        tracker.finish_chapter(i, duration_s=elapsed)
+
+        # Update manifest entry
+        entry = ChapterCacheEntry(
+            chapter_index=i,
+            text_hash=text_hash,
+            casting_hash=current_casting_hash,
+            render_params_hash=current_params_hash,
+            wav_path=target_path.name,
+            duration_s=chapter.duration_seconds,
+            status="ok",
+            created_at=utc_now_iso(),
+        )
+        record(entry)
+        reusable[entry.wav_path] = entry
+        cached_wavs.add(entry.wav_path)
+
+        summary.rendered += 1
+        logger.info(
+            f"RENDER_OK: chapter={i} title={chapter.title!r} "
+            f"elapsed={elapsed:.1f}s duration={chapter.duration_seconds:.1f}s"
+        )
+
+    def finish_failed(
+        i: int, chapter: "Chapter", tmp_path: Path, text_hash: str, e: Exception,
+    ) -> None:
+        # Clean up partial tmp file
+        if tmp_path.exists():
+            tmp_path.unlink(missing_ok=True)
+
+        tracker.mark_failed(i, chapter.title)
+
+        # Record failure in manifest (prior OK chapters are preserved)
+        entry = ChapterCacheEntry(
+            chapter_index=i,
+            text_hash=text_hash,
+            casting_hash=current_casting_hash,
+            render_params_hash=current_params_hash,
+            wav_path="",
+            status="failed",
+            error_summary=str(e)[:200],
+            created_at=utc_now_iso(),
+        )
+        record(entry)
+
+        # Record in failure report
+        failure_report.add_failure(
+            chapter_index=i,
+            chapter_title=chapter.title,
+            error=e,
+        )
+
+        summary.failed += 1
+        summary.failed_chapters.append({
+            "index": i,
+            "title": chapter.title,
+            "error": str(e),
+        })
+
+        logger.error(f"RENDER_CHAPTER_FAIL: chapter={i} error={e}")
+
+        if not allow_partial:
+            # Write failure report before raising
+            failure_report.rendered_ok = summary.rendered
+            failure_report.cached_ok = summary.skipped_cached
+            failure_report.save()
+
+            raise RenderError(
+                f"Chapter {i} ({chapter.title!r}) failed: {e}",
+                summary=summary,
+            ) from e
+
     try:
+        # Target WAV name -> chapters waiting on it (worker pool only)
+        pending: dict[str, list[tuple[int, "Chapter", str, Path]]] = {}
+
         for i, chapter in enumerate(project.chapters):
             if from_chapter is not None and i < from_chapter:
                 # Skip chapters before the requested start
                 if progress_callback:
-                    progress_callback(i + 1, len(project.chapters), f"Skipping: {chapter.title}")
+                    progress_callback(i + 1, total, f"Skipping: {chapter.title}")
                 continue
 
             current_text_hash = chapter_text_hash(chapter)
@@ -319,9 +508,12 @@ def render_project(
             # Check cache
             if resume:
                 existing = manifest.get_entry(i)
-                if existing and existing.is_valid(current_text_hash, current_casting_hash, current_params_hash):
+                if existing and existing.is_valid(
+                    current_text_hash, current_casting_hash, current_params_hash,
+                    present=cached_wavs, cache_root=cache_root,
+                ):
                     # Cache hit — restore chapter state from cache
-                    chapter.audio_path = Path(existing.wav_path)
+                    chapter.audio_path = existing.resolve_wav_path(cache_root)
                     chapter.duration_seconds = existing.duration_s
                     tracker.mark_cached(i, chapter.title, existing.duration_s)
                     logger.info(f"RENDER_CACHE_HIT: chapter={i} title={chapter.title!r}")
@@ -329,108 +521,144 @@ def render_project(
 
                     if progress_callback:
                         status = tracker.format_chapter_status(i, f"Cached: {chapter.title}")
-                        progress_callback(i + 1, len(project.chapters), status)
+                        progress_callback(i + 1, total, status)
                     continue
 
-            # Cache miss — render this chapter
-            tracker.start_chapter(i, chapter.title, word_count=chapter.word_count)
+            target_path = get_content_wav_path(
+                cache_root, current_text_hash, utterances_hash(chapter),
+                current_casting_hash, current_params_hash,
+            )
 
-            if progress_callback:
-                status = tracker.format_chapter_status(i, f"Rendering: {chapter.title}")
-                progress_callback(i + 1, len(project.chapters), status)
+            # Same audio already rendered for another chapter: reuse it.
+            # The WAV name covers script, casting and params, so only the
+            # file's presence needs checking.
+            source = reusable.get(target_path.name)
+            if source is not None and (
+                target_path.name in cached_wavs or target_path.exists()
+            ):
+                mark_reused(i, chapter, target_path, source.duration_s, current_text_hash)
+                continue
 
-            target_path = get_chapter_wav_path(cache_root, i)
+            if workers > 1:
+                # Chapters sharing a target are rendered once, by the pool
+                pending.setdefault(target_path.name, []).append(
+                    (i, chapter, current_text_hash, target_path)
+                )
+                continue
+
+            # Cache miss — render this chapter
+            start_render(i, chapter)
             tmp_path = target_path.with_suffix(".wav.tmp")
 
             start = time.time()
             try:
                 render_chapter(chapter, project.casting, tmp_path, engine=engine)
-
-                # Atomic rename: tmp → final
-                if target_path.exists():
-                    target_path.unlink()
-                os.rename(str(tmp_path), str(target_path))
-
-                # Update chapter to point at cached path
-                chapter.audio_path = target_path
-                # duration_seconds is set by render_chapter
-
-                elapsed = time.time() - start
-                tracker.finish_chapter(i, duration_s=elapsed)
-
-                # Update manifest entry
-                entry = ChapterCacheEntry(
-                    chapter_index=i,
-                    text_hash=current_text_hash,
-                    casting_hash=current_casting_hash,
-                    render_params_hash=current_params_hash,
-                    wav_path=str(target_path),
-                    duration_s=chapter.duration_seconds,
-                    status="ok",
-                    created_at=datetime.now(timezone.utc).isoformat(),
-                )
-                manifest.set_entry(entry)
-                save_manifest(manifest, manifest_path)
-
-                summary.rendered += 1
-                logger.info(
-                    f"RENDER_OK: chapter={i} title={chapter.title!r} "
-                    f"elapsed={elapsed:.1f}s duration={chapter.duration_seconds:.1f}s"
+                finish_ok(
+                    i, chapter, target_path, tmp_path,
+                    current_text_hash, time.time() - start,
                 )
-
             except Exception as e:
-                # Clean up partial tmp file
-                if tmp_path.exists():
-                    tmp_path.unlink(missing_ok=True)
-
-                tracker.mark_failed(i, chapter.title)
-
-                # Record failure in manifest (prior OK chapters are preserved)
-                entry = ChapterCacheEntry(
-                    chapter_index=i,
-                    text_hash=current_text_hash,
-                    casting_hash=current_casting_hash,
-                    render_params_hash=current_params_hash,
-                    wav_path="",
-                    status="failed",
-                    error_summary=str(e)[:200],
-                    created_at=datetime.now(timezone.utc).isoformat(),
-                )
-                manifest.set_entry(entry)
-                save_manifest(manifest, manifest_path)
-
-                # Record in failure report
-                failure_report.add_failure(
-                    chapter_index=i,
-                    chapter_title=chapter.title,
-                    error=e,
-                )
-
-                summary.failed += 1
-                summary.failed_chapters.append({
-                    "index": i,
-                    "title": chapter.title,
-                    "error": str(e),
-                })
-
-                logger.error(f"RENDER_CHAPTER_FAIL: chapter={i} error={e}")
-
-                if not allow_partial:
-                    # Write failure report before raising
-                    failure_report.rendered_ok = summary.rendered
-                    failure_report.cached_ok = summary.skipped_cached
-                    failure_report.save()
-
-                    raise RenderError(
-                        f"Chapter {i} ({chapter.title!r}) failed: {e}",
-                        summary=summary,
-                    ) from e
+                finish_failed(i, chapter, tmp_path, current_text_hash, e)
+
+        if pending:
+            # Load the default engine here, not racily on each worker
+            if engine is None:
+                engine = get_default_engine()
+
+            # Engine calls run on worker threads; manifest, tracker and
+            # progress updates stay on this thread. Workers report when
+            # they pick a chapter up and when it ends, so queue wait
+            # doesn't count as rendering.
+            events: queue.SimpleQueue = queue.SimpleQueue()
+
+            def run_job(group: list) -> None:
+                _, chapter, _, target_path = group[0]
+                events.put((group, "started", None))
+                started = time.time()
+                try:
+                    render_chapter(
+                        chapter, project.casting,
+                        target_path.with_suffix(".wav.tmp"), engine=engine,
+                    )
+                except BaseException as e:
+                    events.put((group, "failed", e))
+                    raise
+                events.put((group, "done", time.time() - started))
+
+            # Longest chapters first, so a big one isn't left straggling
+            groups = sorted(
+                pending.values(),
+                key=lambda group: sum(len(u.text) for u in group[0][1].utterances),
+                reverse=True,
+            )
+            pool = ThreadPoolExecutor(max_workers=min(workers, len(groups)))
+            try:
+                for group in groups:
+                    i, chapter, _, _ = group[0]
+                    logger.info(f"RENDER_QUEUED: chapter={i} title={chapter.title!r}")
+                    pool.submit(run_job, group)
+
+                outstanding = len(groups)
+                while outstanding:
+                    group, kind, value = events.get()
+                    i, chapter, current_text_hash, target_path = group[0]
+                    if kind == "started":
+                        start_render(i, chapter)
+                        continue
+
+                    outstanding -= 1
+                    tmp_path = target_path.with_suffix(".wav.tmp")
+                    try:
+                        if kind == "failed":
+                            raise value
+                        finish_ok(
+                            i, chapter, target_path, tmp_path,
+                            current_text_hash, value,
+                        )
+                    except Exception as e:
+                        for j, other, other_hash, _ in group:
+                            finish_failed(j, other, tmp_path, other_hash, e)
+                        continue
+                    for j, other, other_hash, _ in group[1:]:
+                        mark_reused(
+                            j, other, target_path,
+                            chapter.duration_seconds, other_hash,
+                        )
+            finally:
+                # Fail-fast: drop queued chapters, then clear partial files
+                pool.shutdown(wait=True, cancel_futures=True)
+                for group in groups:
+                    group[0][3].with_suffix(".wav.tmp").unlink(missing_ok=True)
+
+        # Fold the journal into the snapshot now that chapters are done
+        if journaled:
+            save_manifest(manifest, manifest_path)
+            journaled = 0
+
+        # Drop WAVs nothing points at any more (superseded renders). Only
+        # a resumed, full-book pass has a manifest that covers every
+        # chapter; otherwise skipped chapters' renders would look unused.
+        chapters_dir = get_chapters_dir(cache_root)
+        if resume and from_chapter is None:
+            keep = {e.wav_path for e in manifest.chapters if e.wav_path}
+            keep.update(
+                c.audio_path.name for c in project.chapters
+                if c.audio_path and c.audio_path.parent == chapters_dir
+            )
+            removed = remove_unreferenced_wavs(cache_root, keep)
+            if removed:
+                logger.info(f"RENDER_CACHE_GC: removed={removed}")
 
         # Verify all chapters are ready for assembly
         ok_paths = []
         for i, chapter in enumerate(project.chapters):
-            if chapter.audio_path and chapter.audio_path.exists():
-                ok_paths.append((chapter.audio_path, chapter.title, chapter.duration_seconds))
+            audio_path = chapter.audio_path
+            # Cache WAVs seen this run are known present; others need a stat()
+            if audio_path and (
+                (audio_path.name in cached_wavs and audio_path.parent == chapters_dir)
+                or audio_path.exists()
+            ):
+                ok_paths.append((audio_path, chapter.title, chapter.duration_seconds))
             elif not allow_partial:
                 raise RenderError(
                     f"Chapter {i} ({chapter.title!r}) has no audio — "
@@ -13,11 +13,13 @@ from __future__ import annotations
 
 import json
 import traceback
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+from audiobooker import _json
+
 
 @dataclass
 class FailedUtterance:
@@ -28,6 +30,15 @@ class FailedUtterance:
     voice_id: str = ""
     emotion: str = ""
 
+    def to_dict(self) -> dict:
+        return {
+            "index": self.index,
+            "speaker": self.speaker,
+            "text_preview": self.text_preview,
+            "voice_id": self.voice_id,
+            "emotion": self.emotion,
+        }
+
 
 @dataclass
 class FailedChapter:
@@ -38,6 +49,17 @@ class FailedChapter:
     stack_trace: str = ""
     failed_utterance: Optional[FailedUtterance] = None
 
+    def to_dict(self) -> dict:
+        return {
+            "chapter_index": self.chapter_index,
+            "chapter_title": self.chapter_title,
+            "error_message": self.error_message,
+            "stack_trace": self.stack_trace,
+            "failed_utterance": (
+                self.failed_utterance.to_dict() if self.failed_utterance else None
+            ),
+        }
+
 
 @dataclass
 class RenderFailureReport:
@@ -88,8 +110,18 @@ class RenderFailureReport:
         self.failed_count = len(self.failed_chapters)
 
     def to_dict(self) -> dict:
-        """Serialize to dictionary."""
-        return asdict(self)
+        """Serialize to dictionary (explicit fields, no asdict deep copy)."""
+        return {
+            "timestamp": self.timestamp,
+            "book_title": self.book_title,
+            "total_chapters": self.total_chapters,
+            "rendered_ok": self.rendered_ok,
+            "cached_ok": self.cached_ok,
+            "failed_count": self.failed_count,
+            "failed_chapters": [fc.to_dict() for fc in self.failed_chapters],
+            "cache_dir": self.cache_dir,
+            "manifest_path": self.manifest_path,
+        }
 
     def to_json(self) -> str:
         """Serialize to JSON string."""
@@ -113,7 +145,8 @@ class RenderFailureReport:
 
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(self.to_json(), encoding="utf-8")
+        # Same indented UTF-8 layout as to_json(), without the str round trip
+        path.write_bytes(_json.dumps_bytes(self.to_dict()))
         return path
 
     @classmethod
@@ -144,5 +177,4 @@ class RenderFailureReport:
     @classmethod
     def load(cls, path: Path) -> "RenderFailureReport":
         """Load report from JSON file."""
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return cls.from_dict(data)
+        return cls.from_dict(_json.loads(path.read_bytes()))
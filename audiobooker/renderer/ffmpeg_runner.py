@@ -31,5 +31,6 @@ class RealFFmpegRunner:
             )
 
     def available(self) -> bool:
-        result = self.run(["ffmpeg", "-version"])
-        return result.returncode == 0
+        from audiobooker.renderer.output import check_ffmpeg
+
+        return check_ffmpeg()
@@ -8,9 +8,10 @@ Only audio-affecting inputs go into hashes — cosmetic changes
 from __future__ import annotations
 
 import hashlib
-import json
 from typing import TYPE_CHECKING
 
+from audiobooker._json import canonical_bytes
+
 if TYPE_CHECKING:
     from audiobooker.models import Chapter, CastingTable, ProjectConfig
 
@@ -22,13 +23,28 @@ def sha256_text(s: str) -> str:
 
 def sha256_json(obj: dict | list) -> str:
     """SHA-256 of canonical JSON (sorted keys, no whitespace)."""
-    canonical = json.dumps(obj, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
-    return sha256_text(canonical)
+    return hashlib.sha256(canonical_bytes(obj)).hexdigest()
 
 
 def chapter_text_hash(chapter: "Chapter") -> str:
-    """Hash the text content that affects audio output."""
-    return sha256_text(chapter.raw_text)
+    """
+    Hash the text content that affects audio output.
+
+    Memoized on the chapter for as long as raw_text is the same string
+    object, so repeat renders of an unchanged chapter skip re-hashing.
+    """
+    text = chapter.raw_text
+    cached = chapter._text_hash_cache
+    if cached is not None and cached[0] is text:
+        return cached[1]
+    digest = sha256_text(text)
+    chapter._text_hash_cache = (text, digest)
+    return digest
+
+
+def utterances_hash(chapter: "Chapter") -> str:
+    """Hash the compiled script (speaker, text, emotion per utterance)."""
+    return sha256_json([[u.speaker, u.text, u.emotion] for u in chapter.utterances])
 
 
 def casting_hash(casting: "CastingTable") -> str:
@@ -6,14 +6,28 @@ with chapter markers and metadata using FFmpeg.
 """
 
 import logging
+import os
+import re
 import subprocess
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 logger = logging.getLogger("audiobooker.output")
 
+# Anything but letters, digits, space, '-' and '_' (same as str.isalnum)
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w -]")
+
+# Lines of FFmpeg stderr kept for errors and warnings
+_STDERR_TAIL_LINES = 20
+
+# Concurrent ffprobe processes when filling in missing chapter durations
+_PROBE_WORKERS = 8
+
 
 @dataclass
 class AssemblyResult:
@@ -23,19 +37,37 @@ class AssemblyResult:
     chapter_error: str = ""
 
 
+@lru_cache(maxsize=1)
 def check_ffmpeg() -> bool:
-    """Check if FFmpeg is available."""
+    """Check if FFmpeg is available (probed once per process)."""
     try:
         result = subprocess.run(
             ["ffmpeg", "-version"],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         return result.returncode == 0
     except FileNotFoundError:
         return False
 
 
+def _run_ffmpeg(args: list[str]) -> tuple[int, str]:
+    """
+    Run an ffmpeg command line, returning (returncode, stderr tail).
+
+    Progress stats and the banner are switched off and stdout is
+    discarded; stderr is captured as bytes and only its last lines
+    are decoded for error messages.
+    """
+    result = subprocess.run(
+        [args[0], "-hide_banner", "-nostats", *args[1:]],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    tail = result.stderr.strip().splitlines()[-_STDERR_TAIL_LINES:]
+    return result.returncode, b"\n".join(tail).decode("utf-8", errors="replace")
+
+
 def get_audio_duration(audio_path: Path) -> float:
     """
     Get duration of audio file in seconds using ffprobe.
@@ -63,6 +95,25 @@ def get_audio_duration(audio_path: Path) -> float:
         return 0.0
 
 
+def get_audio_durations(audio_paths: list[Path]) -> list[float]:
+    """
+    Get durations of several audio files, probing them concurrently.
+
+    Each probe is an ffprobe subprocess, so threads overlap the
+    process startup and I/O waits.
+
+    Args:
+        audio_paths: Paths to audio files
+
+    Returns:
+        Durations in seconds, in the same order
+    """
+    if len(audio_paths) <= 1:
+        return [get_audio_duration(p) for p in audio_paths]
+    with ThreadPoolExecutor(max_workers=min(_PROBE_WORKERS, len(audio_paths))) as pool:
+        return list(pool.map(get_audio_duration, audio_paths))
+
+
 def generate_chapter_metadata(
     chapters: list[tuple[Path, str, float]],
     chapter_pause_ms: int = 2000,
@@ -84,10 +135,15 @@ def generate_chapter_metadata(
     current_time_ms = 0
     pause_ms = chapter_pause_ms
 
+    # Probe all missing durations up front, in one concurrent batch
+    probed = iter(get_audio_durations(
+        [audio_path for audio_path, _, duration in chapters if duration <= 0]
+    ))
+
     for i, (audio_path, title, duration) in enumerate(chapters):
         # Get actual duration if not provided
         if duration <= 0:
-            duration = get_audio_duration(audio_path)
+            duration = next(probed)
 
         duration_ms = int(duration * 1000)
 
@@ -105,6 +161,43 @@ def generate_chapter_metadata(
     return "\n".join(lines)
 
 
+def _write_concat_list(
+    audio_files: list[Path],
+    work_dir: Path,
+    pause_ms: int = 2000,
+) -> Path:
+    """
+    Write an FFmpeg concat-demuxer list with pauses between files.
+
+    A single silence clip is generated in work_dir (only if a pause is
+    needed) and listed for every gap.
+
+    Returns:
+        Path to the concat list file
+    """
+    concat_file = work_dir / "concat.txt"
+    silence_path: Optional[Path] = None
+
+    with open(concat_file, "w", encoding="utf-8") as f:
+        for i, audio_path in enumerate(audio_files):
+            # Add audio file
+            f.write(f"file '{audio_path.absolute()}'\n")
+
+            # Add silence between chapters (except after last)
+            if i < len(audio_files) - 1 and pause_ms > 0:
+                if silence_path is None:
+                    silence_path = work_dir / "silence.wav"
+                    _run_ffmpeg([
+                        "ffmpeg", "-y",
+                        "-f", "lavfi",
+                        "-i", f"anullsrc=r=24000:cl=mono:d={pause_ms/1000}",
+                        str(silence_path),
+                    ])
+                f.write(f"file '{silence_path.absolute()}'\n")
+
+    return concat_file
+
+
 def concatenate_audio_files(
     audio_files: list[Path],
     output_path: Path,
@@ -127,56 +220,28 @@ def concatenate_audio_files(
             "Install from: https://ffmpeg.org/download.html"
         )
 
-    # Create concat file list
-    with tempfile.NamedTemporaryFile(
-        mode="w",
-        suffix=".txt",
-        delete=False,
-        encoding="utf-8",
-    ) as f:
-        concat_file = Path(f.name)
-
-        for i, audio_path in enumerate(audio_files):
-            # Add audio file
-            f.write(f"file '{audio_path.absolute()}'\n")
-
-            # Add silence between chapters (except after last)
-            if i < len(audio_files) - 1 and pause_ms > 0:
-                # Generate silence file
-                silence_path = Path(tempfile.mktemp(suffix=".wav"))
-                subprocess.run(
-                    [
-                        "ffmpeg", "-y",
-                        "-f", "lavfi",
-                        "-i", f"anullsrc=r=24000:cl=mono:d={pause_ms/1000}",
-                        str(silence_path),
-                    ],
-                    capture_output=True,
-                )
-                f.write(f"file '{silence_path.absolute()}'\n")
+    work_dir = Path(tempfile.mkdtemp(prefix="audiobooker_concat_"))
 
     try:
-        # Concatenate
-        result = subprocess.run(
-            [
-                "ffmpeg", "-y",
-                "-f", "concat",
-                "-safe", "0",
-                "-i", str(concat_file),
-                "-c", "copy",
-                str(output_path),
-            ],
-            capture_output=True,
-            text=True,
-        )
+        concat_file = _write_concat_list(audio_files, work_dir, pause_ms)
 
-        if result.returncode != 0:
-            raise RuntimeError(f"FFmpeg concat failed: {result.stderr}")
+        # Concatenate
+        returncode, stderr_tail = _run_ffmpeg([
+            "ffmpeg", "-y",
+            "-f", "concat",
+            "-safe", "0",
+            "-i", str(concat_file),
+            "-c", "copy",
+            str(output_path),
+        ])
+
+        if returncode != 0:
+            raise RuntimeError(f"FFmpeg concat failed: {stderr_tail}")
 
         return output_path
 
     finally:
-        concat_file.unlink(missing_ok=True)
+        shutil.rmtree(work_dir, ignore_errors=True)
 
 
 def assemble_m4b(
@@ -189,6 +254,12 @@ def assemble_m4b(
     """
     Assemble chapter audio files into M4B audiobook.
 
+    Chapters are concatenated, encoded to AAC and tagged with chapter
+    markers in a single FFmpeg pass, so the book-length audio is written
+    once. If that pass fails, the audio is encoded without chapters.
+    The book is encoded in a temp directory and moved into place only
+    once a pass succeeds.
+
     Args:
         chapter_files: List of (audio_path, chapter_title, duration_seconds)
         output_path: Output M4B path
@@ -206,13 +277,18 @@ def assemble_m4b(
         )
 
     output_path = Path(output_path)
+
+    # A missing chapter would fail both passes; don't encode the book twice
+    audio_paths = [p for p, _, _ in chapter_files]
+    missing = [p for p in audio_paths if not Path(p).is_file()]
+    if missing:
+        raise RuntimeError(f"Chapter audio not found: {missing[0]}")
+
     temp_dir = Path(tempfile.mkdtemp(prefix="audiobooker_m4b_"))
 
     try:
-        # Step 1: Concatenate all audio files
-        audio_paths = [p for p, _, _ in chapter_files]
-        concat_path = temp_dir / "concat.wav"
-        concatenate_audio_files(audio_paths, concat_path, chapter_pause_ms)
+        # Step 1: List all audio files (with pauses) for the concat demuxer
+        concat_path = _write_concat_list(audio_paths, temp_dir, chapter_pause_ms)
 
         # Step 2: Generate chapter metadata
         metadata_content = generate_chapter_metadata(chapter_files, chapter_pause_ms)
@@ -227,58 +303,45 @@ def assemble_m4b(
         metadata_path = temp_dir / "metadata.txt"
         metadata_path.write_text(metadata_content, encoding="utf-8")
 
-        # Step 3: Convert to M4B with chapters
-        # First convert to AAC
-        aac_path = temp_dir / "audio.m4a"
+        # Step 3: Concatenate, encode to AAC and embed chapters in one pass
+        encoded_path = temp_dir / f"audio{output_path.suffix or '.m4b'}"
+        concat_input = ["-f", "concat", "-safe", "0", "-i", str(concat_path)]
+        aac_output = ["-c:a", "aac", "-b:a", "128k", "-ar", "24000", str(encoded_path)]
+
+        returncode, chapter_error = _run_ffmpeg([
+            "ffmpeg", "-y",
+            *concat_input,
+            "-i", str(metadata_path),
+            "-map", "0:a",
+            "-map_metadata", "1",
+            *aac_output,
+        ])
+
+        if returncode == 0:
+            _move_into_place(encoded_path, output_path)
+            return AssemblyResult(
+                output_path=output_path,
+                chapters_embedded=True,
+            )
 
-        result = subprocess.run(
-            [
-                "ffmpeg", "-y",
-                "-i", str(concat_path),
-                "-c:a", "aac",
-                "-b:a", "128k",
-                "-ar", "24000",
-                str(aac_path),
-            ],
-            capture_output=True,
-            text=True,
-        )
+        # Fallback: same pass without the chapter metadata
+        returncode, stderr_tail = _run_ffmpeg(["ffmpeg", "-y", *concat_input, *aac_output])
 
-        if result.returncode != 0:
-            raise RuntimeError(f"FFmpeg AAC conversion failed: {result.stderr}")
+        if returncode != 0:
+            raise RuntimeError(f"FFmpeg AAC conversion failed: {stderr_tail}")
 
-        # Add chapter metadata
-        result = subprocess.run(
-            [
-                "ffmpeg", "-y",
-                "-i", str(aac_path),
-                "-i", str(metadata_path),
-                "-map", "0:a",
-                "-map_metadata", "1",
-                "-c", "copy",
-                str(output_path),
-            ],
-            capture_output=True,
-            text=True,
-        )
+        _move_into_place(encoded_path, output_path)
 
-        if result.returncode != 0:
-            # Log the actual FFmpeg error so it's never invisible
-            stderr_tail = "\n".join(result.stderr.strip().splitlines()[-20:])
-            logger.warning(
-                "Chapter embedding failed, producing M4A without chapters.\n"
-                f"FFmpeg stderr (last 20 lines):\n{stderr_tail}"
-            )
-            shutil.copy(aac_path, output_path)
-            return AssemblyResult(
-                output_path=output_path,
-                chapters_embedded=False,
-                chapter_error=stderr_tail,
-            )
+        # Log the actual FFmpeg error so it's never invisible
+        logger.warning(
+            "Chapter embedding failed, produced M4A without chapters.\n"
+            f"FFmpeg stderr (last 20 lines):\n{chapter_error}"
+        )
 
         return AssemblyResult(
             output_path=output_path,
-            chapters_embedded=True,
+            chapters_embedded=False,
+            chapter_error=chapter_error,
         )
 
     finally:
@@ -286,6 +349,15 @@ def assemble_m4b(
         shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+def _move_into_place(src: Path, dest: Path) -> None:
+    """Move a finished file to dest, replacing it (copies across filesystems)."""
+    try:
+        os.replace(src, dest)
+    except OSError:
+        # Temp dir on another filesystem
+        shutil.move(str(src), str(dest))
+
+
 def assemble_mp3_chapters(
     chapter_files: list[tuple[Path, str, float]],
     output_dir: Path,
@@ -309,30 +381,45 @@ def assemble_mp3_chapters(
     output_dir.mkdir(parents=True, exist_ok=True)
 
     mp3_paths = []
+    commands = []
 
     for i, (audio_path, chapter_title, _) in enumerate(chapter_files):
         # Sanitize filename
-        safe_title = "".join(c if c.isalnum() or c in " -_" else "_" for c in chapter_title)
+        safe_title = _UNSAFE_FILENAME_CHARS.sub("_", chapter_title)
         mp3_path = output_dir / f"{i+1:02d}_{safe_title}.mp3"
 
-        result = subprocess.run(
-            [
-                "ffmpeg", "-y",
-                "-i", str(audio_path),
-                "-c:a", "libmp3lame",
-                "-b:a", "128k",
-                "-metadata", f"title={chapter_title}",
-                "-metadata", f"album={title}",
-                "-metadata", f"track={i+1}",
-                str(mp3_path),
-            ],
-            capture_output=True,
-            text=True,
-        )
-
-        if result.returncode != 0:
-            raise RuntimeError(f"FFmpeg MP3 conversion failed: {result.stderr}")
-
+        commands.append([
+            "ffmpeg", "-y",
+            "-i", str(audio_path),
+            "-c:a", "libmp3lame",
+            "-b:a", "128k",
+            "-metadata", f"title={chapter_title}",
+            "-metadata", f"album={title}",
+            "-metadata", f"track={i+1}",
+            str(mp3_path),
+        ])
         mp3_paths.append(mp3_path)
 
+    # Chapters encode independently (libmp3lame is single-threaded)
+    workers = min(len(commands), os.cpu_count() or 1)
+    if workers <= 1:
+        for command in commands:
+            _encode_mp3(command)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_encode_mp3, command) for command in commands]
+            try:
+                for future in futures:
+                    future.result()
+            except Exception:
+                pool.shutdown(wait=True, cancel_futures=True)
+                raise
+
     return mp3_paths
+
+
+def _encode_mp3(command: list[str]) -> None:
+    """Run one chapter's MP3 encode, raising on FFmpeg failure."""
+    returncode, stderr_tail = _run_ffmpeg(command)
+    if returncode != 0:
+        raise RuntimeError(f"FFmpeg MP3 conversion failed: {stderr_tail}")
@@ -14,7 +14,7 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ChapterProgress:
     """Progress for a single chapter."""
     index: int
@@ -30,6 +30,11 @@ class RenderProgressTracker:
     """
     Tracks rendering progress with dynamic ETA.
 
+    Entries are indexed by chapter index and counted by status. Update
+    them through the methods below; entries added to or removed from
+    ``chapters`` directly are picked up, but a status set directly on an
+    entry is not counted until the list length next changes.
+
     Usage:
         tracker = RenderProgressTracker(total_chapters=10)
         tracker.start_chapter(0, "Chapter 1", word_count=3000)
@@ -41,9 +46,21 @@ class RenderProgressTracker:
     chapters: list[ChapterProgress] = field(default_factory=list)
     start_time: float = 0.0
 
-    # Learned stats
-    _render_durations: list[float] = field(default_factory=list)
-    _words_rendered: list[int] = field(default_factory=list)
+    # Learned stats (running totals over rendered chapters)
+    _render_count: int = 0
+    _duration_total: float = 0.0
+    _words_total: int = 0
+
+    # chapter index -> position in chapters, entries per status, and how
+    # many list entries they cover (not part of the tracker's identity);
+    # rebuilt when stale
+    _index: dict[int, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False,
+    )
+    _status_counts: dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False,
+    )
+    _indexed_len: int = field(default=0, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if not self.start_time:
@@ -58,56 +75,98 @@ class RenderProgressTracker:
             start_time=time.time(),
             word_count=word_count,
         )
-        # Replace or append
-        for i, existing in enumerate(self.chapters):
-            if existing.index == index:
-                self.chapters[i] = progress
-                return
-        self.chapters.append(progress)
+        self._put(progress)
 
     def finish_chapter(self, index: int, duration_s: float = 0.0) -> None:
         """Mark a chapter as done."""
-        for ch in self.chapters:
-            if ch.index == index:
-                ch.status = "done"
-                ch.duration_s = duration_s
-                self._render_durations.append(duration_s)
-                if ch.word_count > 0:
-                    self._words_rendered.append(ch.word_count)
-                return
+        pos = self._position(index)
+        if pos is None:
+            return
+        ch = self.chapters[pos]
+        self._set_status(ch, "done")
+        ch.duration_s = duration_s
+        self._render_count += 1
+        self._duration_total += duration_s
+        if ch.word_count > 0:
+            self._words_total += ch.word_count
 
     def mark_cached(self, index: int, title: str, duration_s: float = 0.0) -> None:
         """Mark a chapter as cached/skipped."""
-        progress = ChapterProgress(
+        self._put(ChapterProgress(
             index=index, title=title, status="cached", duration_s=duration_s,
-        )
-        for i, existing in enumerate(self.chapters):
-            if existing.index == index:
-                self.chapters[i] = progress
-                return
-        self.chapters.append(progress)
+        ))
 
     def mark_failed(self, index: int, title: str) -> None:
         """Mark a chapter as failed."""
-        for ch in self.chapters:
-            if ch.index == index:
-                ch.status = "failed"
-                return
-        self.chapters.append(ChapterProgress(index=index, title=title, status="failed"))
+        pos = self._position(index)
+        if pos is None:
+            self._put(ChapterProgress(index=index, title=title, status="failed"))
+        else:
+            self._set_status(self.chapters[pos], "failed")
+
+    def _reindex(self) -> None:
+        """Rebuild the index and status counts from ``chapters``."""
+        index: dict[int, int] = {}
+        counts: dict[str, int] = {}
+        for pos, ch in enumerate(self.chapters):
+            # First entry wins, as with a front-to-back scan
+            index.setdefault(ch.index, pos)
+            counts[ch.status] = counts.get(ch.status, 0) + 1
+        self._index = index
+        self._status_counts = counts
+        self._indexed_len = len(self.chapters)
+
+    def _position(self, index: int) -> Optional[int]:
+        """Position of a chapter's entry in chapters (None if absent)."""
+        chapters = self.chapters
+        pos = self._index.get(index)
+        if pos is not None:
+            if pos < len(chapters) and chapters[pos].index == index:
+                return pos
+        elif self._indexed_len == len(chapters):
+            return None
+        # Index stale (chapters edited directly): rebuild
+        self._reindex()
+        return self._index.get(index)
+
+    def _count(self, status: str) -> int:
+        if self._indexed_len != len(self.chapters):
+            self._reindex()
+        return self._status_counts.get(status, 0)
+
+    def _set_status(self, ch: ChapterProgress, status: str) -> None:
+        counts = self._status_counts
+        counts[ch.status] = counts.get(ch.status, 0) - 1
+        counts[status] = counts.get(status, 0) + 1
+        ch.status = status
+
+    def _put(self, progress: ChapterProgress) -> None:
+        """Replace a chapter's entry, or append it."""
+        pos = self._position(progress.index)
+        counts = self._status_counts
+        if pos is None:
+            self._index[progress.index] = len(self.chapters)
+            self.chapters.append(progress)
+            self._indexed_len = len(self.chapters)
+        else:
+            old = self.chapters[pos].status
+            counts[old] = counts.get(old, 0) - 1
+            self.chapters[pos] = progress
+        counts[progress.status] = counts.get(progress.status, 0) + 1
 
     # ---- Stats ----
 
     @property
     def rendered_count(self) -> int:
-        return sum(1 for ch in self.chapters if ch.status == "done")
+        return self._count("done")
 
     @property
     def cached_count(self) -> int:
-        return sum(1 for ch in self.chapters if ch.status == "cached")
+        return self._count("cached")
 
     @property
     def failed_count(self) -> int:
-        return sum(1 for ch in self.chapters if ch.status == "failed")
+        return self._count("failed")
 
     @property
     def completed_count(self) -> int:
@@ -126,27 +185,26 @@ class RenderProgressTracker:
     @property
     def avg_render_duration_s(self) -> float:
         """Average seconds per rendered chapter (excludes cached)."""
-        if not self._render_durations:
+        if not self._render_count:
             return 0.0
-        return sum(self._render_durations) / len(self._render_durations)
+        return self._duration_total / self._render_count
 
     @property
     def estimated_wpm(self) -> float:
         """Observed words-per-minute from rendered chapters."""
-        if not self._render_durations or not self._words_rendered:
+        if not self._render_count or not self._words_total:
             return 150.0  # default
-        total_words = sum(self._words_rendered)
-        total_duration_min = sum(self._render_durations) / 60.0
+        total_duration_min = self._duration_total / 60.0
         if total_duration_min == 0:
             return 150.0
-        return total_words / total_duration_min
+        return self._words_total / total_duration_min
 
     def eta_seconds(self) -> Optional[float]:
         """Estimated time remaining in seconds."""
         remaining = self.total_chapters - self.completed_count - self.failed_count
         if remaining <= 0:
             return 0.0
-        if not self._render_durations:
+        if not self._render_count:
             return None  # Can't estimate yet
         return remaining * self.avg_render_duration_s
 
@@ -22,7 +22,12 @@ class SynthesisResult:
 
 @runtime_checkable
 class TTSEngine(Protocol):
-    """Interface for text-to-speech synthesis."""
+    """
+    Interface for text-to-speech synthesis.
+
+    With ProjectConfig.render_workers > 1, one engine instance renders
+    several chapters concurrently, so synthesize() must be thread-safe.
+    """
 
     def synthesize(
         self,
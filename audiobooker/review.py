@@ -44,6 +44,25 @@ SPEAKER_PATTERN = re.compile(r'^@(\w+)(?:\s*\(([^)]+)\))?$')
 # Pattern for chapter marker: === Chapter Title ===
 CHAPTER_PATTERN = re.compile(r'^===\s*(.+?)\s*===$')
 
+# Write buffer for streaming review exports
+_WRITE_BUFFER_BYTES = 1 << 16
+
+# Review file header (formatted once per export)
+_REVIEW_HEADER_TEMPLATE = """\
+# Audiobooker Review File
+# Title: {title}
+# Author: {author}
+#
+# Instructions:
+#   - Edit speaker names by changing @OldName to @NewName
+#   - Edit emotions by changing @Name (old) to @Name (new)
+#   - Delete entire speaker blocks to remove them
+#   - Add emotions: @narrator -> @narrator (somber)
+#   - Lines starting with # are comments (ignored)
+#
+# After editing, import with: audiobooker review-import {filename}
+"""
+
 
 def export_for_review(project: "AudiobookProject", output_path: Optional[Path] = None) -> Path:
     """
@@ -61,59 +80,48 @@ def export_for_review(project: "AudiobookProject", output_path: Optional[Path] =
     else:
         output_path = Path(output_path)
 
-    lines = []
-
-    # Header
-    lines.append("# Audiobooker Review File")
-    lines.append(f"# Title: {project.title}")
-    lines.append(f"# Author: {project.author}")
-    lines.append("#")
-    lines.append("# Instructions:")
-    lines.append("#   - Edit speaker names by changing @OldName to @NewName")
-    lines.append("#   - Edit emotions by changing @Name (old) to @Name (new)")
-    lines.append("#   - Delete entire speaker blocks to remove them")
-    lines.append("#   - Add emotions: @narrator -> @narrator (somber)")
-    lines.append("#   - Lines starting with # are comments (ignored)")
-    lines.append("#")
-    lines.append(f"# After editing, import with: audiobooker review-import {output_path.name}")
-    lines.append("")
+    # Stream lines straight to the file rather than building the whole
+    # book in memory. Each chapter block opens with the blank line that
+    # separates it from the header or the previous chapter.
+    with output_path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER_BYTES) as f:
+        write = f.write
+        write(_REVIEW_HEADER_TEMPLATE.format(
+            title=project.title,
+            author=project.author,
+            filename=output_path.name,
+        ))
 
-    for chapter in project.chapters:
-        # Chapter header
-        lines.append(f"=== {chapter.title} ===")
-        lines.append("")
-
-        if not chapter.utterances:
-            lines.append("# (Chapter not compiled - no utterances)")
-            lines.append("")
-            continue
+        for chapter in project.chapters:
+            # Chapter header
+            write(f"\n=== {chapter.title} ===\n\n")
 
-        current_speaker = None
-        current_emotion = None
+            if not chapter.utterances:
+                write("# (Chapter not compiled - no utterances)\n")
+                continue
 
-        for utterance in chapter.utterances:
-            # Check if speaker/emotion changed
-            if utterance.speaker != current_speaker or utterance.emotion != current_emotion:
-                # Add blank line before new speaker (except at start)
-                if current_speaker is not None:
-                    lines.append("")
+            current_speaker = None
+            current_emotion = None
 
-                # Speaker tag
-                if utterance.emotion:
-                    lines.append(f"@{utterance.speaker} ({utterance.emotion})")
-                else:
-                    lines.append(f"@{utterance.speaker}")
+            for utterance in chapter.utterances:
+                # Check if speaker/emotion changed
+                if utterance.speaker != current_speaker or utterance.emotion != current_emotion:
+                    # Add blank line before new speaker (except at start)
+                    if current_speaker is not None:
+                        write("\n")
 
-                current_speaker = utterance.speaker
-                current_emotion = utterance.emotion
+                    # Speaker tag
+                    if utterance.emotion:
+                        write(f"@{utterance.speaker} ({utterance.emotion})\n")
+                    else:
+                        write(f"@{utterance.speaker}\n")
 
-            # Text content (indent for readability)
-            lines.append(utterance.text)
+                    current_speaker = utterance.speaker
+                    current_emotion = utterance.emotion
 
-        lines.append("")  # Blank line after chapter
+                # Text content
+                write(utterance.text)
+                write("\n")
 
-    # Write file
-    output_path.write_text("\n".join(lines), encoding="utf-8")
     return output_path
 
 
@@ -178,22 +186,28 @@ def import_reviewed(project: "AudiobookProject", review_path: Path) -> dict:
         if not line_stripped:
             continue
 
+        # Markers and tags are prefix-dispatched so plain text lines
+        # never reach the regex engine.
+        first = line_stripped[0]
+
         # Check for chapter marker
-        chapter_match = CHAPTER_PATTERN.match(line_stripped)
-        if chapter_match:
-            flush_chapter()
-            current_chapter_title = chapter_match.group(1)
-            current_speaker = None
-            current_emotion = None
-            continue
+        if first == "=":
+            chapter_match = CHAPTER_PATTERN.match(line_stripped)
+            if chapter_match:
+                flush_chapter()
+                current_chapter_title = chapter_match.group(1)
+                current_speaker = None
+                current_emotion = None
+                continue
 
         # Check for speaker tag
-        speaker_match = SPEAKER_PATTERN.match(line_stripped)
-        if speaker_match:
-            flush_utterance()
-            current_speaker = speaker_match.group(1)
-            current_emotion = speaker_match.group(2)
-            continue
+        elif first == "@":
+            speaker_match = SPEAKER_PATTERN.match(line_stripped)
+            if speaker_match:
+                flush_utterance()
+                current_speaker = speaker_match.group(1)
+                current_emotion = speaker_match.group(2)
+                continue
 
         # Regular text line - accumulate
         if current_speaker:
@@ -209,26 +223,31 @@ def import_reviewed(project: "AudiobookProject", review_path: Path) -> dict:
         "speakers_found": set(),
     }
 
+    # Title -> chapter; the first chapter wins on duplicate titles
+    chapters_by_title = {}
+    for chapter in project.chapters:
+        chapters_by_title.setdefault(chapter.title, chapter)
+
+    dialogue = UtteranceType.DIALOGUE
+    narration = UtteranceType.NARRATION
+
     for chapter_data in chapters_data:
         # Find matching chapter by title
-        matching_chapter = None
-        for chapter in project.chapters:
-            if chapter.title == chapter_data["title"]:
-                matching_chapter = chapter
-                break
-
+        matching_chapter = chapters_by_title.get(chapter_data["title"])
         if matching_chapter is None:
             continue
 
         # Rebuild utterances
         new_utterances = []
+        chapter_index = matching_chapter.index
         for i, utt_data in enumerate(chapter_data["utterances"]):
+            text = utt_data["text"]
             utterance = Utterance(
                 speaker=utt_data["speaker"],
-                text=utt_data["text"],
-                utterance_type=UtteranceType.DIALOGUE if utt_data["text"].startswith('"') else UtteranceType.NARRATION,
+                text=text,
+                utterance_type=dialogue if text.startswith('"') else narration,
                 emotion=utt_data["emotion"],
-                chapter_index=matching_chapter.index,
+                chapter_index=chapter_index,
                 line_index=i,
             )
             new_utterances.append(utterance)
@@ -166,6 +166,29 @@ class TestCompileChapter:
         # Alice should have line count updated
         assert casting.characters["alice"].line_count == 2
 
+    def test_parallel_compile_matches_serial(self):
+        """compile_workers > 1 yields the same utterances and line counts."""
+        from audiobooker.project import AudiobookProject
+
+        def build(workers):
+            project = AudiobookProject(title="Parallel")
+            project.config.compile_workers = workers
+            project.config.booknlp_mode = "off"
+            project.cast("Alice", "af_bella")
+            project.chapters = [
+                Chapter(index=i, title=f"Ch {i}",
+                        raw_text=f'Scene {i}. "Hi" said Alice.\n\n"Bye," Bob replied.')
+                for i in range(4)
+            ]
+            project.compile()
+            return project
+
+        serial, parallel = build(1), build(2)
+        assert [[u.to_dict() for u in c.utterances] for c in parallel.chapters] == \
+            [[u.to_dict() for u in c.utterances] for c in serial.chapters]
+        assert parallel.casting.characters["alice"].line_count == 4
+        assert serial.casting.characters["alice"].line_count == 4
+
 
 class TestUtterancesToScript:
     """Tests for script conversion."""
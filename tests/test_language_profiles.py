@@ -59,10 +59,47 @@ class TestLanguageProfileRegistry:
         p = get_profile("en")
         assert len(p.chapter_patterns) >= 4
 
+    def test_compiled_chapter_patterns_cached(self):
+        p = get_profile("en")
+        compiled = p.compiled_chapter_patterns
+        assert [c.pattern for c in compiled] == list(p.chapter_patterns)
+        assert p.compiled_chapter_patterns is compiled
+
+    def test_attribution_patterns_cached(self):
+        p = get_profile("en")
+        assert p.said_patterns is p.said_patterns
+        assert p.emotion_verb_pattern is p.emotion_verb_pattern
+        assert p.build_said_patterns() == list(p.said_patterns)
+        assert p.build_emotion_verb_pattern() is p.emotion_verb_pattern
+        assert p.is_valid_name("Alice") and not p.is_valid_name("alice")
+
+    def test_pattern_lists_stored_as_tuples(self):
+        from audiobooker.parser.text import split_into_chapters
+
+        p = LanguageProfile(
+            code="xx",
+            name="Test",
+            chapter_patterns=[r"^#\s+(.+)$"],
+            scene_break_patterns=[r"^\*\*\*$"],
+        )
+        assert p.chapter_patterns == (r"^#\s+(.+)$",)
+        assert p.scene_break_patterns == (r"^\*\*\*$",)
+        assert len(split_into_chapters("# A\nx\n# B\ny", profile=p)) == 2
+
     def test_english_profile_has_scene_break_patterns(self):
         p = get_profile("en")
         assert len(p.scene_break_patterns) >= 3
 
+    def test_scene_break_detection(self):
+        from audiobooker.parser.text import is_scene_break
+
+        p = get_profile("en")
+        assert p.scene_break_re is p.scene_break_re
+        assert is_scene_break("  * * *  ", profile=p)
+        assert is_scene_break("###")
+        assert not is_scene_break("### Heading")
+        assert not is_scene_break("Plain prose.")
+
 
 # ---------------------------------------------------------------------------
 # Profile-driven dialogue detection (same as hardcoded English)
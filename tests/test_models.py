@@ -74,6 +74,13 @@ class TestUtterance:
         assert restored.chapter_index == u.chapter_index
         assert restored.line_index == u.line_index
 
+    def test_serialization_omits_unset_emotion(self):
+        """Unset emotion is left out of the dict and restored as None."""
+        u = Utterance(speaker="narrator", text="Quiet.")
+        data = u.to_dict()
+        assert "emotion" not in data
+        assert Utterance.from_dict(data).emotion is None
+
 
 class TestChapter:
     """Tests for Chapter dataclass."""
@@ -87,6 +94,14 @@ class TestChapter:
         )
         assert chapter.word_count == 5
 
+    def test_word_count_follows_text_edits(self):
+        """Cached word count is refreshed when raw_text is reassigned."""
+        chapter = Chapter(index=0, title="Chapter 1", raw_text="One two three.")
+        assert chapter.word_count == 3
+        assert chapter.word_count == 3
+        chapter.raw_text = "Just two."
+        assert chapter.word_count == 2
+
     def test_estimated_duration(self):
         """Test estimated duration calculation."""
         # 150 words = 1 minute
@@ -107,6 +122,21 @@ class TestChapter:
         )
         assert chapter.is_compiled
 
+    def test_speakers(self):
+        """Distinct speakers reflect the current utterances."""
+        chapter = Chapter(index=0, title="Test", raw_text="Hello")
+        assert chapter.speakers == set()
+
+        chapter.utterances = [
+            Utterance(speaker="narrator", text="Hello"),
+            Utterance(speaker="Alice", text="Hi"),
+            Utterance(speaker="narrator", text="Bye"),
+        ]
+        assert chapter.speakers == {"narrator", "Alice"}
+
+        chapter.utterances[1].speaker = "Bob"
+        assert chapter.speakers == {"narrator", "Bob"}
+
     def test_serialization(self):
         """Test to_dict and from_dict."""
         chapter = Chapter(
@@ -127,6 +157,17 @@ class TestChapter:
         assert restored.raw_text == chapter.raw_text
         assert len(restored.utterances) == 1
 
+    def test_serialization_omits_unset_paths(self):
+        """Unset source_file/audio_path are left out and restored as None."""
+        chapter = Chapter(index=0, title="Test", raw_text="Hello")
+        data = chapter.to_dict()
+        assert "source_file" not in data
+        assert "audio_path" not in data
+
+        restored = Chapter.from_dict(data)
+        assert restored.source_file is None
+        assert restored.audio_path is None
+
 
 class TestCastingTable:
     """Tests for CastingTable."""
@@ -44,6 +44,23 @@ class TestHtmlToText:
         assert "color" not in text
         assert "Text" in text
 
+    def test_lxml_matches_htmlparser_extractor(self):
+        """The lxml fast path produces the same text as HTMLTextExtractor."""
+        pytest.importorskip("lxml")
+        from audiobooker.parser.epub import HTMLTextExtractor, _lxml_html_to_text
+
+        html = (
+            "<?xml version='1.0' encoding='utf-8'?>"
+            "<html xmlns='http://www.w3.org/1999/xhtml'>"
+            "<head><title>Ignored</title><style>p {}</style></head>"
+            "<body><!-- note -->Intro<h1>Chapter &#8220;One&#8221;</h1>"
+            "<p>Caf\u00e9 &amp; <em>tea</em>,<br/>  served.</p>"
+            "<nav>Skip me</nav>tail</body></html>"
+        )
+        extractor = HTMLTextExtractor()
+        extractor.feed(html)
+        assert _lxml_html_to_text(html) == extractor.get_text()
+
 
 class TestExtractTitle:
     """Tests for title extraction from HTML."""
@@ -66,6 +83,16 @@ class TestExtractTitle:
         title = extract_title_from_html(html)
         assert title is None
 
+    def test_heading_preferred_over_title_tag(self):
+        """A heading wins even when <title> appears first."""
+        html = "<head><title>Book</title></head><body><h1>Chapter  One</h1></body>"
+        assert extract_title_from_html(html) == "Chapter One"
+
+    def test_title_tag_used_when_heading_blank(self):
+        """A blank heading falls back to a later <title>."""
+        html = "<h1>   </h1><title>Fallback</title>"
+        assert extract_title_from_html(html) == "Fallback"
+
 
 class TestExtractFrontmatter:
     """Tests for YAML frontmatter extraction."""
@@ -138,6 +165,57 @@ More content.
         pattern = detect_chapter_pattern(text)
         assert pattern is None
 
+    def test_overlapping_patterns_counted_independently(self):
+        """Every pattern a line satisfies is tallied, not just the first."""
+        from dataclasses import replace
+        from audiobooker.language.profile import get_profile
+
+        en = get_profile("en")
+        profile = replace(
+            en,
+            code="en-test",
+            chapter_patterns=(r"^(\w+)\s+(\d+)$",) + en.chapter_patterns,
+        )
+        text = "Chapter 1\nBody.\nChapter 2\nBody.\nChapter 3: End\nBody."
+        pattern = detect_chapter_pattern(text, profile=profile)
+        assert pattern is not None
+        assert pattern.pattern == en.chapter_patterns[0]
+
+    def test_custom_patterns_on_replaced_profile(self):
+        """Headings from replaced patterns are detected whatever they start with."""
+        from dataclasses import replace
+        from audiobooker.language.profile import get_profile
+
+        text = "Scene 1\nBody.\nScene 2\nBody."
+        profile = replace(
+            get_profile("en"),
+            code="en-test",
+            chapter_patterns=(r"^Scene\s+(\d+)$",),
+        )
+        assert detect_chapter_pattern(text, profile=profile) is not None
+
+    def test_non_ascii_digit_headings(self):
+        """Numbered headings using non-ASCII digits are still detected."""
+        text = "\u0661. The Start\nBody.\n\u0662. The End\nBody."
+        pattern = detect_chapter_pattern(text)
+        assert pattern is not None
+        assert pattern.pattern.startswith(r"^(\d+)")
+
+    def test_uncombinable_patterns_fall_back(self):
+        """Patterns with inline global flags still detect via the slow path."""
+        from dataclasses import replace
+        from audiobooker.language.profile import get_profile
+
+        profile = replace(
+            get_profile("en"),
+            code="en-test",
+            chapter_patterns=(r"^#\s+(.+)$", r"(?i)^chapter\s+(\d+)$"),
+        )
+        assert profile.chapter_scanner is None
+        pattern = detect_chapter_pattern("chapter 1\nx\nCHAPTER 2\ny", profile=profile)
+        assert pattern is not None
+        assert pattern.pattern == r"(?i)^chapter\s+(\d+)$"
+
 
 class TestSplitIntoChapters:
     """Tests for chapter splitting."""
@@ -233,3 +311,84 @@ The adventure begins."""
 
         finally:
             temp_path.unlink()
+
+
+class TestReadTextFile:
+    """Tests for the memory-mapped text reader."""
+
+    @pytest.mark.parametrize("data", [
+        b"",
+        b"plain",
+        b"windows\r\nlines\r\n",
+        b"old mac\rlines",
+        "caf\u00e9\n".encode("utf-8"),
+    ])
+    def test_matches_text_mode_read(self, tmp_path, data):
+        """Same content as open(..., encoding='utf-8').read()."""
+        from audiobooker.parser.text import _read_text_file
+
+        path = tmp_path / "book.txt"
+        path.write_bytes(data)
+        with open(path, "r", encoding="utf-8") as f:
+            expected = f.read()
+        assert _read_text_file(path) == expected
+
+
+class TestParseEpub:
+    """Tests for EPUB parsing."""
+
+    def test_chapters_keep_spine_order(self, tmp_path):
+        """Parallel extraction still yields chapters in document order."""
+        pytest.importorskip("ebooklib")
+        from ebooklib import epub
+        from audiobooker.parser.epub import parse_epub
+
+        book = epub.EpubBook()
+        book.set_identifier("order-test")
+        book.set_title("Order")
+        book.set_language("en")
+        items = []
+        for i in range(12):
+            item = epub.EpubHtml(title=f"c{i}", file_name=f"c{i}.xhtml", lang="en")
+            words = "word " * (3 if i == 5 else 60)
+            item.content = f"<h1>Part {i}</h1><p>{words}</p>"
+            book.add_item(item)
+            items.append(item)
+        book.toc = items
+        book.spine = items
+        book.add_item(epub.EpubNcx())
+        book.add_item(epub.EpubNav())
+        path = tmp_path / "order.epub"
+        epub.write_epub(str(path), book)
+
+        _, chapters = parse_epub(path, keep_titled_short_chapters=False)
+        titles = [c.title for c in chapters if c.title.startswith("Part")]
+        assert titles == [f"Part {i}" for i in range(12) if i != 5]
+        assert [c.index for c in chapters] == list(range(len(chapters)))
+
+
+class TestLazyImports:
+    """Package-level parser exports are imported on demand."""
+
+    def test_text_parser_does_not_load_epub_stack(self):
+        """Importing the text parser leaves the EPUB parser unloaded."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, audiobooker.parser.text; "
+            "print('audiobooker.parser.epub' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, check=True,
+        )
+        assert out.stdout.strip() == "False"
+
+    def test_package_exports_resolve(self):
+        """parse_epub/parse_text are still importable from the package."""
+        from audiobooker.parser import parse_epub, parse_text
+        from audiobooker.parser.epub import parse_epub as epub_impl
+
+        assert parse_epub is epub_impl
+        assert callable(parse_text)
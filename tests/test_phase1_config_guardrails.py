@@ -331,3 +331,61 @@ class TestFullProjectRoundtrip:
             assert loaded.config.min_chapter_words == 30
             assert loaded.config.keep_titled_short_chapters is False
             assert loaded.casting.fallback_voice_id == "am_fenrir"
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_save_output_matches_stdlib_json(self, use_orjson, monkeypatch):
+        """Saved file is identical with or without orjson and loads back."""
+        import audiobooker._json as json_mod
+        from audiobooker.models import Chapter
+        from audiobooker.project import AudiobookProject
+
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(json_mod, "orjson", None)
+
+        project = AudiobookProject(title="Café — «Test»")
+        project.chapters = [Chapter(index=0, title="Un", raw_text="Déjà vu.")]
+        project.cast("narrator", "bm_george")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "test.audiobooker"
+            project.save(path)
+            raw = path.read_text(encoding="utf-8")
+            assert raw == json.dumps(json.loads(raw), indent=2, ensure_ascii=False)
+
+            loaded = AudiobookProject.load(path)
+            assert loaded.title == "Café — «Test»"
+            assert loaded.chapters[0].raw_text == "Déjà vu."
+
+
+class TestProjectInfo:
+    """info() summary gathered in one pass over the chapters."""
+
+    def test_info_totals(self, tmp_path):
+        from audiobooker.models import Chapter, Utterance
+        from audiobooker.project import AudiobookProject
+
+        project = AudiobookProject(title="Info Book")
+        project.cast("narrator", "bm_george")
+        wav = tmp_path / "ch0.wav"
+        wav.write_bytes(b"")
+        project.chapters = [
+            Chapter(index=0, title="One", raw_text="one two three",
+                    audio_path=wav, utterances=[
+                        Utterance(speaker="narrator", text="one two three"),
+                        Utterance(speaker="Alice", text="hi"),
+                    ]),
+            Chapter(index=1, title="Two", raw_text="four five"),
+        ]
+
+        info = project.info()
+        assert info["total_words"] == 5 == project.total_words
+        assert info["uncast_speakers"] == ["alice"]
+        assert info["compiled"] is False
+        assert info["rendered"] is False
+
+        project.chapters.pop()
+        info = project.info()
+        assert info["compiled"] is True
+        assert info["rendered"] is True
@@ -155,6 +155,116 @@ class TestSpeakerResolver:
         assert stats.speakers_unchanged == 1
         assert chapter.utterances[0].speaker == "Alice"
 
+    def test_loose_match_ignores_punctuation_drift(self):
+        """Quotes differing only in punctuation/spacing still match."""
+        from audiobooker.nlp.speaker_resolver import SpeakerResolver
+        from audiobooker.nlp.booknlp_adapter import QuoteAttribution
+
+        fake = self._make_fake_adapter(quotes=[
+            QuoteAttribution(quote_text="Well, hello  there!", speaker="Marcus", start=0, end=19, confidence=0.9),
+        ])
+        resolver = SpeakerResolver(mode="on", adapter=fake)
+
+        chapter = Chapter(index=0, title="Ch1", raw_text='"Well hello there" he said.')
+        chapter.utterances = [
+            Utterance(speaker="unknown", text="Well hello there", utterance_type=UtteranceType.DIALOGUE),
+            Utterance(speaker="unknown", text="Goodbye", utterance_type=UtteranceType.DIALOGUE),
+        ]
+
+        stats = resolver.resolve([chapter], CastingTable())
+        assert chapter.utterances[0].speaker == "Marcus"
+        assert chapter.utterances[1].speaker == "unknown"
+        assert stats.speakers_resolved == 1
+
+    def test_fuzzy_tier(self):
+        """With a threshold set, near-matches resolve via rapidfuzz."""
+        pytest.importorskip("rapidfuzz")
+        from audiobooker.nlp.speaker_resolver import SpeakerResolver
+        from audiobooker.nlp.booknlp_adapter import QuoteAttribution
+
+        fake = self._make_fake_adapter(quotes=[
+            QuoteAttribution(quote_text="I told you we should have turned left", speaker="Marcus", start=0, end=37, confidence=0.9),
+        ])
+        utterance_text = "I told you we should have turned left back there"
+
+        strict = SpeakerResolver(mode="on", adapter=fake)
+        chapter = Chapter(index=0, title="Ch1", raw_text="x")
+        chapter.utterances = [Utterance(speaker="unknown", text=utterance_text)]
+        strict.resolve([chapter], CastingTable())
+        assert chapter.utterances[0].speaker == "unknown"
+
+        fuzzy = SpeakerResolver(mode="on", adapter=fake, fuzzy_threshold=90)
+        fuzzy.resolve([chapter], CastingTable())
+        assert chapter.utterances[0].speaker == "Marcus"
+
+    def test_analysis_memoized_per_text(self):
+        """Re-resolving the same chapter text reuses the cached analysis."""
+        from audiobooker.nlp.speaker_resolver import SpeakerResolver
+        from audiobooker.nlp.booknlp_adapter import QuoteAttribution
+
+        fake = self._make_fake_adapter(quotes=[
+            QuoteAttribution(quote_text="Hello there", speaker="Marcus", start=0, end=11, confidence=0.9),
+        ])
+        calls = []
+        analyze = fake.analyze
+        fake.analyze = lambda text: calls.append(text) or analyze(text)
+        resolver = SpeakerResolver(mode="on", adapter=fake)
+
+        for _ in range(2):
+            chapter = Chapter(index=0, title="Ch1", raw_text='"Hello there" he said.')
+            chapter.utterances = [
+                Utterance(speaker="unknown", text="Hello there", utterance_type=UtteranceType.DIALOGUE),
+            ]
+            resolver.resolve([chapter], CastingTable())
+            assert chapter.utterances[0].speaker == "Marcus"
+
+        assert len(calls) == 1
+
+    def test_chapter_without_unknowns_skips_analysis(self):
+        """No 'unknown' utterances means nothing to resolve and no NLP call."""
+        from audiobooker.nlp.speaker_resolver import SpeakerResolver
+
+        fake = self._make_fake_adapter()
+        calls = []
+        analyze = fake.analyze
+        fake.analyze = lambda text: calls.append(text) or analyze(text)
+        resolver = SpeakerResolver(mode="on", adapter=fake)
+
+        chapter = Chapter(index=0, title="Ch1", raw_text='"Hi" Alice said.')
+        chapter.utterances = [
+            Utterance(speaker="Alice", text="Hi", utterance_type=UtteranceType.DIALOGUE),
+            Utterance(speaker="narrator", text="Alice said."),
+        ]
+
+        stats = resolver.resolve([chapter], CastingTable())
+        assert calls == []
+        assert stats.utterances_examined == 2
+        assert stats.speakers_unchanged == 2
+
+    def test_failed_analysis_not_memoized(self):
+        """A failed analysis is retried on the next pass."""
+        from audiobooker.nlp.speaker_resolver import SpeakerResolver
+        from audiobooker.nlp.booknlp_adapter import BookNLPResult
+
+        calls = []
+
+        class FailingAdapter:
+            def is_available(self):
+                return True
+
+            def analyze(self, text):
+                calls.append(text)
+                return BookNLPResult(success=False, error="boom")
+
+        resolver = SpeakerResolver(mode="on", adapter=FailingAdapter())
+        chapter = Chapter(index=0, title="Ch1", raw_text="text")
+        chapter.utterances = [Utterance(speaker="unknown", text="Hello")]
+
+        resolver.resolve([chapter], CastingTable())
+        stats = resolver.resolve([chapter], CastingTable())
+        assert stats.nlp_error == "boom"
+        assert len(calls) == 2
+
     def test_invalid_mode_raises(self):
         """Invalid mode raises ValueError."""
         from audiobooker.nlp.speaker_resolver import SpeakerResolver
@@ -200,6 +310,54 @@ class TestEmotionInferencer:
         assert result.label == "fearful"
         assert result.source == "lexicon"
 
+    def test_lexicon_word_prefilter(self):
+        """Word prefilter skips plain prose but keeps multi-word and cased hits."""
+        from audiobooker.nlp.emotion import EmotionInferencer
+        inf = EmotionInferencer(mode="rule", threshold=0.75)
+        assert inf._check_lexicon("The cart rolled past the old mill.") is None
+        assert inf._check_lexicon("Sadness filled the hall.") is None
+        assert inf._check_lexicon("I CAN'T  wait!").label == "excited"
+        assert inf._check_lexicon("she spoke under her breath").label == "whisper"
+        assert inf._check_lexicon("“Furious,” he said.").label == "angry"
+
+    def test_lexicon_heads_match_patterns(self):
+        """Every lexicon match starts with one of its entry's heads, and every head is used."""
+        import re
+        from audiobooker.nlp.emotion import _ASCII_WORD_FOLD, _EMOTION_LEXICON
+
+        phrases = [
+            "furious", "enraged", "livid", "seething", "infuriated",
+            "angry", "mad", "outraged", "irate", "incensed",
+            "annoyed", "irritated", "frustrated",
+            "sobbing", "weeping", "grieving", "mourning", "heartbroken",
+            "crying", "tears", "sorrowful", "miserable", "devastated",
+            "sad", "unhappy", "gloomy", "melancholy",
+            "ecstatic", "overjoyed", "elated", "jubilant", "thrilled",
+            "delighted", "joyful", "excited", "gleeful", "beaming",
+            "happy", "pleased", "cheerful", "glad", "smiling",
+            "terrified", "petrified", "horrified", "panic",
+            "frightened", "scared", "afraid", "alarmed", "trembling",
+            "nervous", "anxious", "worried", "uneasy",
+            "whispered", "hissed", "murmured", "breathed",
+            "softly", "quietly", "hushed",
+            "under his breath", "under her breath", "under  their\nbreath",
+            "can't wait", "CAN'T   WAIT", "incredible", "amazing", "fantastic", "wonderful",
+            "eager", "enthusiastic", "pumped", "exhilarated",
+        ]
+        unmatched = set(phrases)
+        for patterns in _EMOTION_LEXICON.values():
+            for pat, _conf, heads in patterns:
+                compiled = re.compile(pat, re.IGNORECASE | re.ASCII)
+                used = set()
+                for phrase in phrases:
+                    for m in compiled.finditer(phrase):
+                        first = m.group().encode("ascii").translate(_ASCII_WORD_FOLD).split()[0]
+                        assert first.decode() in heads, (pat, phrase)
+                        used.add(first.decode())
+                        unmatched.discard(phrase)
+                assert used == set(heads), pat
+        assert not unmatched
+
     def test_low_confidence_stays_neutral(self):
         """Below threshold → neutral."""
         from audiobooker.nlp.emotion import EmotionInferencer
@@ -397,6 +555,76 @@ class TestRenderProgressTracker:
         assert "cached" in summary
 
 
+    def test_learned_rates(self):
+        """Average duration and WPM come from rendered chapters only."""
+        from audiobooker.renderer.progress import RenderProgressTracker
+        tracker = RenderProgressTracker(total_chapters=4)
+        assert tracker.avg_render_duration_s == 0.0
+        assert tracker.estimated_wpm == 150.0
+
+        tracker.mark_cached(0, "Ch0", 500.0)
+        tracker.start_chapter(1, "Ch1", word_count=300)
+        tracker.finish_chapter(1, duration_s=30.0)
+        tracker.start_chapter(2, "Ch2")
+        tracker.finish_chapter(2, duration_s=90.0)
+
+        assert tracker.avg_render_duration_s == 60.0
+        assert tracker.estimated_wpm == 150.0  # 300 words / 2 minutes
+        assert tracker.eta_seconds() == 60.0
+
+    def test_restarted_chapter_replaces_its_entry(self):
+        """Re-marking a chapter updates it in place rather than appending."""
+        from audiobooker.renderer.progress import RenderProgressTracker
+        tracker = RenderProgressTracker(total_chapters=3)
+        for i in range(3):
+            tracker.start_chapter(i, f"Ch{i}")
+        tracker.mark_failed(1, "Ch1")
+        tracker.start_chapter(1, "Ch1")
+        tracker.finish_chapter(1, duration_s=2.0)
+        tracker.mark_cached(2, "Ch2")
+
+        assert [(c.index, c.status) for c in tracker.chapters] == [
+            (0, "rendering"), (1, "done"), (2, "cached"),
+        ]
+        assert tracker.rendered_count == 1 and tracker.failed_count == 0
+
+    def test_counts_survive_direct_edits(self):
+        """Direct edits don't break counting; list changes resync it."""
+        from audiobooker.renderer.progress import ChapterProgress, RenderProgressTracker
+        tracker = RenderProgressTracker(total_chapters=3)
+        tracker.start_chapter(0, "Ch0")
+        tracker.start_chapter(1, "Ch1")
+
+        tracker.chapters[0].status = "pending"
+        tracker.finish_chapter(0, duration_s=1.0)  # no KeyError
+        assert tracker.rendered_count == 1
+
+        tracker.chapters[1].status = "done"
+        tracker.chapters.append(ChapterProgress(index=2, title="Ch2", status="cached"))
+        assert tracker.rendered_count == 2
+        assert tracker.cached_count == 1
+        assert tracker.percent_complete == 100.0
+
+    def test_index_survives_direct_list_edits(self):
+        """Entries replaced in place are still found; the index isn't compared."""
+        from audiobooker.renderer.progress import ChapterProgress, RenderProgressTracker
+        tracker = RenderProgressTracker(total_chapters=2, start_time=1.0)
+        tracker.start_chapter(0, "Ch0")
+        tracker.chapters[0] = ChapterProgress(index=1, title="Ch1", status="rendering")
+        tracker.start_chapter(0, "Ch0")  # stale hit: rebuilds, then appends
+        tracker.finish_chapter(1, duration_s=1.0)
+
+        assert [(c.index, c.status) for c in tracker.chapters] == [
+            (1, "done"), (0, "rendering"),
+        ]
+
+        a = RenderProgressTracker(total_chapters=1, start_time=1.0)
+        b = RenderProgressTracker(total_chapters=1, start_time=1.0)
+        a.mark_cached(0, "Ch0")
+        b.mark_cached(0, "Ch0")
+        a.finish_chapter(5)  # miss: rebuilds a's index only
+        assert a == b
+
 class TestRenderFailureReport:
     """Failure report bundle tests."""
 
@@ -458,6 +686,38 @@ class TestRenderFailureReport:
         assert loaded.book_title == "Roundtrip"
         assert len(loaded.failed_chapters) == 1
 
+    def test_to_dict_matches_asdict(self):
+        """Explicit to_dict stays in step with the dataclass fields."""
+        from dataclasses import asdict
+        from audiobooker.renderer.failure_report import RenderFailureReport
+
+        report = RenderFailureReport(book_title="Fields", total_chapters=2)
+        report.add_failure(0, "Ch1", RuntimeError("a"))
+        report.add_failure(1, "Ch2", RuntimeError("b"), utterance_index=3, speaker="Bob")
+        assert report.to_dict() == asdict(report)
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_save_matches_to_json(self, use_orjson, tmp_path, monkeypatch):
+        """Saved bytes are the same with or without orjson."""
+        import audiobooker._json as json_mod
+        import audiobooker.renderer.failure_report as report_mod
+
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(json_mod, "orjson", None)
+
+        report = report_mod.RenderFailureReport(book_title="Café «Test»")
+        try:
+            raise RuntimeError("déjà\tvu")
+        except RuntimeError as e:
+            report.add_failure(0, "Ch—1", e, utterance_index=2, speaker="Zoë")
+
+        path = report.save(tmp_path / "r.json")
+        assert path.read_text(encoding="utf-8") == report.to_json()
+        loaded = report_mod.RenderFailureReport.load(path)
+        assert loaded.to_dict() == report.to_dict()
+
     def test_empty_report_is_valid(self, tmp_path):
         """Report with no failures is still valid JSON."""
         from audiobooker.renderer.failure_report import RenderFailureReport
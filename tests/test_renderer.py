@@ -6,6 +6,8 @@ All tests are hermetic: no voice-soundboard, no FFmpeg, no network.
 
 from __future__ import annotations
 
+import logging
+import subprocess
 import tempfile
 from pathlib import Path
 
@@ -19,6 +21,7 @@ from audiobooker.models import (
     ProjectConfig,
 )
 from audiobooker.renderer.engine import render_chapter, render_project, RenderLog
+from audiobooker.renderer import output as output_mod
 from audiobooker.renderer.output import generate_chapter_metadata, AssemblyResult
 from audiobooker.renderer.protocols import SynthesisResult
 
@@ -36,7 +39,7 @@ def _make_chapter(index: int = 0, title: str = "Test Chapter", utterances: int =
         ch.utterances.append(
             Utterance(
                 speaker="narrator" if i % 2 == 0 else "Alice",
-                text=f"Utterance {i} text.",
+                text=f"Chapter {index} utterance {i} text.",
                 utterance_type=UtteranceType.NARRATION if i % 2 == 0 else UtteranceType.DIALOGUE,
                 chapter_index=index,
                 line_index=i,
@@ -158,6 +161,44 @@ class TestRenderChapter:
         )
         assert chapter.audio_path is not None
 
+    def test_utterance_progress_is_throttled(self, tmp_path: Path):
+        class ChattyEngine(FakeTTSEngine):
+            def synthesize(self, script, voices, output_path, progress_callback=None):
+                for n in range(1, 1001):
+                    progress_callback(n, 1000, "narrator")
+                return super().synthesize(script, voices, output_path)
+
+        chapter = _make_chapter()
+        casting = _make_casting()
+        calls = []
+        render_chapter(
+            chapter, casting, tmp_path / "ch.wav",
+            progress_callback=lambda current, total: calls.append(current),
+            engine=ChattyEngine(),
+        )
+        assert calls[0] == 1
+        assert calls[-1] == 1000
+        assert len(calls) < 1000
+
+
+# ---------------------------------------------------------------------------
+# Default engine
+# ---------------------------------------------------------------------------
+
+class TestDefaultEngine:
+    def test_loaded_once_per_process(self, monkeypatch):
+        from audiobooker.renderer import engine as engine_mod
+
+        created = []
+        monkeypatch.setattr(engine_mod, "_VoiceSoundboardEngine", lambda: created.append(1) or FakeTTSEngine())
+        engine_mod.get_default_engine.cache_clear()
+        try:
+            first = engine_mod.get_default_engine()
+            assert engine_mod.get_default_engine() is first
+            assert len(created) == 1
+        finally:
+            engine_mod.get_default_engine.cache_clear()
+
 
 # ---------------------------------------------------------------------------
 # render_project
@@ -288,6 +329,26 @@ class TestGenerateChapterMetadata:
         assert "START=6000" in metadata
         assert "END=9000" in metadata
 
+    def test_missing_durations_probed_in_one_batch(self, tmp_path: Path, monkeypatch):
+        probed = []
+
+        def fake_duration(path):
+            probed.append(path)
+            return {"a.wav": 2.0, "c.wav": 4.0}[path.name]
+
+        monkeypatch.setattr(output_mod, "get_audio_duration", fake_duration)
+        chapters = [
+            (tmp_path / "a.wav", "A", 0.0),
+            (tmp_path / "b.wav", "B", 3.0),
+            (tmp_path / "c.wav", "C", 0.0),
+        ]
+        metadata = generate_chapter_metadata(chapters, chapter_pause_ms=0)
+
+        assert sorted(p.name for p in probed) == ["a.wav", "c.wav"]
+        assert "START=0\nEND=2000" in metadata
+        assert "START=2000\nEND=5000" in metadata
+        assert "START=5000\nEND=9000" in metadata
+
     def test_zero_pause(self, tmp_path: Path):
         chapters = [
             (tmp_path / "ch0.wav", "A", 2.0),
@@ -301,6 +362,158 @@ class TestGenerateChapterMetadata:
         assert "END=5000" in metadata
 
 
+# ---------------------------------------------------------------------------
+# concatenate_audio_files (subprocess faked)
+# ---------------------------------------------------------------------------
+
+class _FakeFFmpegRun:
+    """Stands in for subprocess.run: touches outputs, records concat lists."""
+
+    def __init__(self, fail_if: str = ""):
+        self.fail_if = fail_if
+        self.commands: list[list[str]] = []
+        self.concat_lists: list[str] = []
+
+    def __call__(self, args, **kwargs):
+        self.commands.append(list(args))
+        if self.fail_if and self.fail_if in args:
+            return subprocess.CompletedProcess(args, 1, stdout=b"", stderr=b"frame=1\nbad metadata\n")
+        if "concat" in args:
+            self.concat_lists.append(Path(args[args.index("-i") + 1]).read_text(encoding="utf-8"))
+        if not args[-1].startswith("-"):
+            Path(args[-1]).write_bytes(b"")
+        return subprocess.CompletedProcess(args, 0, stdout=b"", stderr=b"")
+
+
+class TestCheckFfmpeg:
+    def test_probed_once(self, monkeypatch):
+        fake = _FakeFFmpegRun()
+        monkeypatch.setattr(output_mod.subprocess, "run", fake)
+        output_mod.check_ffmpeg.cache_clear()
+        try:
+            assert output_mod.check_ffmpeg()
+            assert output_mod.check_ffmpeg()
+            assert fake.commands == [["ffmpeg", "-version"]]
+        finally:
+            output_mod.check_ffmpeg.cache_clear()
+
+
+class TestConcatenateAudioFiles:
+    def test_single_silence_clip_reused_and_cleaned_up(self, tmp_path: Path, monkeypatch):
+        fake = _FakeFFmpegRun()
+        monkeypatch.setattr(output_mod, "check_ffmpeg", lambda: True)
+        monkeypatch.setattr(output_mod.subprocess, "run", fake)
+
+        files = [tmp_path / f"ch{i}.wav" for i in range(3)]
+        output_mod.concatenate_audio_files(files, tmp_path / "out.wav", pause_ms=500)
+
+        listed = [line[len("file '"):-1] for line in fake.concat_lists[0].splitlines()]
+        assert listed[::2] == [str(f.absolute()) for f in files]
+        silences = [Path(p) for p in listed[1::2]]
+        assert len(silences) == 2
+        assert silences[0] == silences[1]  # generated once, reused per gap
+        assert len(fake.commands) == 2  # one silence clip + the concat
+        assert not silences[0].parent.exists()
+
+    def test_no_pause_makes_no_silence(self, tmp_path: Path, monkeypatch):
+        fake = _FakeFFmpegRun()
+        monkeypatch.setattr(output_mod, "check_ffmpeg", lambda: True)
+        monkeypatch.setattr(output_mod.subprocess, "run", fake)
+
+        output_mod.concatenate_audio_files([tmp_path / "a.wav", tmp_path / "b.wav"], tmp_path / "out.wav", pause_ms=0)
+        assert len(fake.commands) == 1
+
+
+class TestAssembleM4b:
+    def _chapters(self, tmp_path: Path):
+        chapters = [(tmp_path / f"ch{i}.wav", f"Chapter {i}", 2.0) for i in range(3)]
+        for path, _, _ in chapters:
+            path.write_bytes(b"")
+        return chapters
+
+    def test_single_encode_pass(self, tmp_path: Path, monkeypatch):
+        fake = _FakeFFmpegRun()
+        monkeypatch.setattr(output_mod, "check_ffmpeg", lambda: True)
+        monkeypatch.setattr(output_mod.subprocess, "run", fake)
+
+        result = output_mod.assemble_m4b(self._chapters(tmp_path), tmp_path / "book.m4b", title="T")
+
+        assert result.chapters_embedded
+        assert result.output_path.exists()
+        encodes = [c for c in fake.commands if "concat" in c]
+        assert len(encodes) == 1
+        assert "-map_metadata" in encodes[0] and "aac" in encodes[0]
+        assert "-nostats" in encodes[0]
+        # Encoded in the temp dir, then moved into place
+        assert Path(encodes[0][-1]).parent != tmp_path
+        assert not Path(encodes[0][-1]).parent.exists()
+
+    def test_falls_back_without_chapters(self, tmp_path: Path, monkeypatch, caplog):
+        fake = _FakeFFmpegRun(fail_if="-map_metadata")
+        monkeypatch.setattr(output_mod, "check_ffmpeg", lambda: True)
+        monkeypatch.setattr(output_mod.subprocess, "run", fake)
+
+        with caplog.at_level(logging.WARNING, logger="audiobooker.output"):
+            result = output_mod.assemble_m4b(self._chapters(tmp_path), tmp_path / "book.m4b")
+
+        assert not result.chapters_embedded
+        assert "bad metadata" in result.chapter_error
+        assert result.output_path.exists()
+        assert "-map_metadata" not in fake.commands[-1]
+        assert "Chapter embedding failed" in caplog.text
+
+    def test_failed_encode_leaves_no_output(self, tmp_path: Path, monkeypatch, caplog):
+        fake = _FakeFFmpegRun(fail_if="aac")
+        monkeypatch.setattr(output_mod, "check_ffmpeg", lambda: True)
+        monkeypatch.setattr(output_mod.subprocess, "run", fake)
+
+        with (
+            caplog.at_level(logging.WARNING, logger="audiobooker.output"),
+            pytest.raises(RuntimeError, match="AAC conversion failed"),
+        ):
+            output_mod.assemble_m4b(self._chapters(tmp_path), tmp_path / "book.m4b")
+
+        assert not (tmp_path / "book.m4b").exists()
+        assert "Chapter embedding failed" not in caplog.text
+
+    def test_missing_chapter_raises_before_encoding(self, tmp_path: Path, monkeypatch):
+        fake = _FakeFFmpegRun()
+        monkeypatch.setattr(output_mod, "check_ffmpeg", lambda: True)
+        monkeypatch.setattr(output_mod.subprocess, "run", fake)
+
+        chapters = self._chapters(tmp_path)
+        chapters[1][0].unlink()
+        with pytest.raises(RuntimeError, match="ch1.wav"):
+            output_mod.assemble_m4b(chapters, tmp_path / "book.m4b")
+
+        assert fake.commands == []
+
+
+class TestAssembleMp3Chapters:
+    def test_encodes_every_chapter_in_order(self, tmp_path: Path, monkeypatch):
+        fake = _FakeFFmpegRun()
+        monkeypatch.setattr(output_mod, "check_ffmpeg", lambda: True)
+        monkeypatch.setattr(output_mod.subprocess, "run", fake)
+        monkeypatch.setattr(output_mod.os, "cpu_count", lambda: 4)
+
+        chapters = [(tmp_path / f"ch{i}.wav", f"Part {i}: Go!", 1.0) for i in range(5)]
+        paths = output_mod.assemble_mp3_chapters(chapters, tmp_path / "mp3", title="Book")
+
+        assert [p.name for p in paths] == [f"{i+1:02d}_Part {i}_ Go_.mp3" for i in range(5)]
+        assert all(p.exists() for p in paths)
+        assert sorted(c[c.index("-i") + 1] for c in fake.commands) == [str(p) for p, _, _ in chapters]
+
+    def test_failure_raises(self, tmp_path: Path, monkeypatch):
+        fake = _FakeFFmpegRun(fail_if="track=2")
+        monkeypatch.setattr(output_mod, "check_ffmpeg", lambda: True)
+        monkeypatch.setattr(output_mod.subprocess, "run", fake)
+        monkeypatch.setattr(output_mod.os, "cpu_count", lambda: 4)
+
+        chapters = [(tmp_path / f"ch{i}.wav", f"C{i}", 1.0) for i in range(3)]
+        with pytest.raises(RuntimeError, match="MP3 conversion failed"):
+            output_mod.assemble_mp3_chapters(chapters, tmp_path / "mp3")
+
+
 # ---------------------------------------------------------------------------
 # AssemblyResult
 # ---------------------------------------------------------------------------
@@ -351,3 +564,27 @@ class TestRenderLog:
         j = log.to_json()
         assert '"error_message": "boom"' in j
         assert '"error_speaker": "Alice"' in j
+
+    def test_to_dict_covers_every_field(self):
+        from dataclasses import asdict
+
+        log = RenderLog(
+            chapter_index=1, chapter_title="T", utterance_count=2, total_chars=3,
+            status="error", error_message="boom", error_utterance_index=0,
+        )
+        assert log.to_dict() == asdict(log)
+
+    def test_log_serializes_only_when_emitted(self, caplog, monkeypatch):
+        log = RenderLog(chapter_index=0, chapter_title="T", utterance_count=1, total_chars=1, status="success")
+        calls = []
+        real_to_json = RenderLog.to_json
+        monkeypatch.setattr(RenderLog, "to_json", lambda self: calls.append(1) or real_to_json(self))
+
+        with caplog.at_level(logging.WARNING, logger="audiobooker.renderer"):
+            log.log()
+        assert calls == []
+
+        with caplog.at_level(logging.INFO, logger="audiobooker.renderer"):
+            log.log()
+        assert calls == [1]
+        assert '"chapter_title": "T"' in caplog.text
@@ -13,7 +13,11 @@ Covers:
 
 from __future__ import annotations
 
+import hashlib
 import json
+import logging
+import threading
+import time
 from pathlib import Path
 
 import pytest
@@ -25,6 +29,7 @@ from audiobooker.project import AudiobookProject
 from audiobooker.renderer.engine import render_chapter, render_project, RenderError, RenderSummary
 from audiobooker.renderer.cache_manifest import (
     CacheManifest, ChapterCacheEntry, load_manifest, save_manifest,
+    append_entry, get_journal_path, utc_now_iso, present_wavs,
     get_cache_root, get_chapter_wav_path, get_manifest_path,
 )
 from audiobooker.renderer.hash_utils import (
@@ -76,6 +81,23 @@ class TestHashUtils:
         b = sha256_json({"a": 2, "b": 1})
         assert a == b
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_sha256_json_independent_of_orjson(self, use_orjson, monkeypatch):
+        """Cache keys must not change with the optional orjson extra."""
+        from audiobooker import _json as json_mod
+
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(json_mod, "orjson", None)
+        for obj in (
+            {"b": [["Zoë \"quoted\"\n\x1f\u2028 😀", None]], "a": {"z": -3, "y": 0}},
+            {"big": 2**70, "keys": {1: "x"}},  # orjson rejects these: stdlib path
+            {"speed": [1e-05, 2.5e-07, 1.0, 0.1], "n": 3},  # floats: stdlib path
+        ):
+            stdlib = json.dumps(obj, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+            assert sha256_json(obj) == hashlib.sha256(stdlib.encode("utf-8")).hexdigest()
+
     def test_chapter_text_hash_changes_on_edit(self):
         ch = _make_chapter(text="original text")
         h1 = chapter_text_hash(ch)
@@ -83,6 +105,13 @@ class TestHashUtils:
         h2 = chapter_text_hash(ch)
         assert h1 != h2
 
+    def test_chapter_text_hash_memoized(self):
+        ch = _make_chapter(text="some text")
+        h1 = chapter_text_hash(ch)
+        assert ch._text_hash_cache == (ch.raw_text, h1)
+        assert chapter_text_hash(ch) == h1 == sha256_text("some text")
+        assert "_text_hash_cache" not in ch.to_dict()
+
     def test_casting_hash_changes_on_voice_change(self):
         casting = CastingTable()
         casting.cast("narrator", "af_heart")
@@ -125,6 +154,37 @@ class TestCacheManifest:
         assert len(loaded.chapters) == 1
         assert loaded.chapters[0].status == "ok"
 
+    def test_journal_replayed_on_load(self, tmp_path: Path):
+        path = tmp_path / "manifest.json"
+        save_manifest(CacheManifest(book_title="Test"), path)
+        for i, status in ((0, "ok"), (1, "failed"), (0, "failed")):
+            append_entry(ChapterCacheEntry(
+                chapter_index=i, text_hash="h", casting_hash="c",
+                render_params_hash="p", wav_path="", status=status,
+            ), path)
+
+        loaded = load_manifest(path)
+        assert loaded.book_title == "Test"
+        assert [(e.chapter_index, e.status) for e in loaded.chapters] == [(0, "failed"), (1, "failed")]
+
+        # A full save folds the journal in and removes it
+        save_manifest(loaded, path)
+        assert not get_journal_path(path).exists()
+        assert len(load_manifest(path).chapters) == 2
+
+    def test_journal_without_snapshot_and_torn_tail(self, tmp_path: Path):
+        path = tmp_path / "manifest.json"
+        append_entry(ChapterCacheEntry(
+            chapter_index=3, text_hash="h", casting_hash="c",
+            render_params_hash="p", wav_path="", status="ok",
+        ), path)
+        with open(get_journal_path(path), "a", encoding="utf-8") as f:
+            f.write('{"chapter_index": 4, "text_ha')
+
+        loaded = load_manifest(path)
+        assert loaded is not None
+        assert [e.chapter_index for e in loaded.chapters] == [3]
+
     def test_load_missing_returns_none(self, tmp_path: Path):
         assert load_manifest(tmp_path / "nope.json") is None
 
@@ -155,6 +215,37 @@ class TestCacheManifest:
         )
         assert not entry.is_valid("a", "b", "c")
 
+    def test_present_wavs_short_circuits_stat(self, tmp_path: Path):
+        wav = get_chapter_wav_path(tmp_path, 0)
+        wav.parent.mkdir(parents=True)
+        write_silence_wav(wav)
+        (wav.parent / "chapter_0001.wav.tmp").write_bytes(b"")
+
+        present = present_wavs(tmp_path)
+        assert present == {wav.name}
+        assert present_wavs(tmp_path / "missing") == set()
+
+        entry = ChapterCacheEntry(
+            chapter_index=0, text_hash="a", casting_hash="b",
+            render_params_hash="c", wav_path=wav.name, status="ok",
+        )
+        assert entry.is_valid("a", "b", "c", present=set(), cache_root=tmp_path)
+        wav.unlink()
+        # Listed as present: trusted without another stat
+        assert entry.is_valid("a", "b", "c", present=present, cache_root=tmp_path)
+        # Not listed: falls back to checking the filesystem
+        assert not entry.is_valid("a", "b", "c", present=set(), cache_root=tmp_path)
+
+    def test_wav_paths_relative_to_cache(self, tmp_path: Path):
+        legacy = {
+            "chapter_index": 0, "text_hash": "a", "casting_hash": "b",
+            "render_params_hash": "c", "wav_path": str(tmp_path / "old" / "chapter_0000.wav"),
+            "status": "ok",
+        }
+        entry = ChapterCacheEntry.from_dict(legacy)
+        assert entry.wav_path == "chapter_0000.wav"
+        assert entry.resolve_wav_path(tmp_path) == get_chapter_wav_path(tmp_path, 0)
+
     def test_entry_invalid_if_status_failed(self, tmp_path: Path):
         wav = tmp_path / "ch.wav"
         write_silence_wav(wav)
@@ -175,6 +266,43 @@ class TestCacheManifest:
         assert len(manifest.chapters) == 1
         assert manifest.chapters[0].text_hash == "new"
 
+    def test_get_entry_index_survives_round_trip_and_appends(self):
+        manifest = CacheManifest()
+        for i in (3, 1, 2):
+            manifest.set_entry(ChapterCacheEntry(chapter_index=i, text_hash=f"h{i}", casting_hash="", render_params_hash="", wav_path=""))
+        manifest.chapters.append(ChapterCacheEntry(chapter_index=7, text_hash="h7", casting_hash="", render_params_hash="", wav_path=""))
+
+        assert manifest.get_entry(2).text_hash == "h2"
+        assert manifest.get_entry(7).text_hash == "h7"
+        assert manifest.get_entry(5) is None
+
+        data = manifest.to_dict()
+        assert "_index" not in data
+        restored = CacheManifest.from_dict(data)
+        assert [restored.get_entry(i).text_hash for i in (1, 2, 3, 7)] == ["h1", "h2", "h3", "h7"]
+
+    def test_status_views_follow_set_entry(self):
+        manifest = CacheManifest()
+        for i, status in ((0, "ok"), (1, "failed"), (2, "ok")):
+            manifest.set_entry(ChapterCacheEntry(chapter_index=i, text_hash="", casting_hash="", render_params_hash="", wav_path="", status=status))
+        assert [e.chapter_index for e in manifest.ok_chapters()] == [0, 2]
+
+        manifest.set_entry(ChapterCacheEntry(chapter_index=1, text_hash="", casting_hash="", render_params_hash="", wav_path="", status="ok"))
+        manifest.set_entry(ChapterCacheEntry(chapter_index=0, text_hash="", casting_hash="", render_params_hash="", wav_path="", status="failed"))
+        manifest.chapters.append(ChapterCacheEntry(chapter_index=3, text_hash="", casting_hash="", render_params_hash="", wav_path="", status="ok"))
+        assert [e.chapter_index for e in manifest.ok_chapters()] == [1, 2, 3]
+        assert [e.chapter_index for e in manifest.failed_chapters()] == [0]
+
+    def test_entry_to_dict_covers_every_field(self):
+        from dataclasses import asdict
+
+        entry = ChapterCacheEntry(
+            chapter_index=2, text_hash="t", casting_hash="c", render_params_hash="p",
+            wav_path="w.wav", duration_s=3.5, status="ok", error_summary="", created_at="now",
+        )
+        assert entry.to_dict() == asdict(entry)
+        assert ChapterCacheEntry(**entry.to_dict()) == entry
+
     def test_atomic_write_survives_interruption(self, tmp_path: Path):
         """Simulate crash: write .tmp but don't rename. Next load returns last good."""
         manifest_path = tmp_path / "render_v1.json"
@@ -197,6 +325,35 @@ class TestCacheManifest:
 # Resume logic (render_project integration)
 # ---------------------------------------------------------------------------
 
+class TestUtcNowIso:
+    def test_parses_as_current_utc(self):
+        from datetime import datetime, timezone
+
+        stamp = datetime.fromisoformat(utc_now_iso())
+        assert stamp.tzinfo is not None
+        assert abs((datetime.now(timezone.utc) - stamp).total_seconds()) < 2
+
+    def test_reused_within_a_second(self, monkeypatch):
+        import audiobooker._timestamps as ts
+
+        monkeypatch.setattr(ts.time, "time_ns", lambda: 1_700_000_000_250_000_000)
+        first = utc_now_iso()
+        assert first == "2023-11-14T22:13:20+00:00"
+        monkeypatch.setattr(ts.time, "time_ns", lambda: 1_700_000_000_900_000_000)
+        assert utc_now_iso() is first
+
+    def test_local_and_utc_cached_separately(self, monkeypatch):
+        from datetime import datetime
+        import audiobooker._timestamps as ts
+
+        monkeypatch.setattr(ts.time, "time_ns", lambda: 1_700_000_000_250_000_000)
+        utc = utc_now_iso()
+        local = ts.now_iso()
+        assert local == datetime.fromtimestamp(1_700_000_000).isoformat()
+        assert utc_now_iso() is utc
+        assert ts.now_iso() is local
+
+
 class TestResumeSkipsUnchanged:
     def test_second_render_skips_all(self, tmp_path: Path):
         """Render once → re-render → no TTS calls."""
@@ -213,6 +370,30 @@ class TestResumeSkipsUnchanged:
         render_project(project, tmp_path / "book2.m4b", engine=engine2, assembler=assembler2, cache_root=cache)
         assert len(engine2.calls) == 0
 
+    def test_resume_does_not_stat_cached_wavs(self, tmp_path: Path, monkeypatch):
+        """Cache hits and the assembly check rely on one directory scan."""
+        project = _make_project(num_chapters=3)
+        cache = tmp_path / "cache"
+        render_project(project, tmp_path / "book1.m4b", engine=FakeTTSEngine(), assembler=FakeAssembler(), cache_root=cache)
+
+        checked = []
+        real_exists = Path.exists
+
+        def spy(self, *args, **kwargs):
+            checked.append(self)
+            return real_exists(self, *args, **kwargs)
+
+        assembled = []
+
+        def assembler(chapter_files, output_path, **kwargs):
+            assembled.extend(p for p, _, _ in chapter_files)
+            return FakeAssembler()(chapter_files=[], output_path=output_path, **kwargs)
+
+        monkeypatch.setattr(Path, "exists", spy)
+        render_project(project, tmp_path / "book2.m4b", engine=FakeTTSEngine(), assembler=assembler, cache_root=cache)
+        assert assembled == [c.audio_path for c in project.chapters]
+        assert not set(assembled) & set(checked)
+
     def test_changed_chapter_text_rerenders_only_that_chapter(self, tmp_path: Path):
         """Change chapter 1's text → only chapter 1 re-rendered."""
         project = _make_project(num_chapters=3)
@@ -229,6 +410,65 @@ class TestResumeSkipsUnchanged:
         render_project(project, tmp_path / "book2.m4b", engine=engine2, assembler=FakeAssembler(), cache_root=cache)
         assert len(engine2.calls) == 1  # only chapter 1
 
+    def test_inserted_chapter_reuses_shifted_audio(self, tmp_path: Path):
+        """Inserting a chapter shifts indices but renders only the new one."""
+        project = _make_project(num_chapters=3)
+        cache = tmp_path / "cache"
+        render_project(project, tmp_path / "b1.m4b", engine=FakeTTSEngine(), assembler=FakeAssembler(), cache_root=cache)
+
+        project.chapters.insert(0, _make_chapter(index=99, title="Prologue", text="A brand new prologue."))
+        engine2 = FakeTTSEngine()
+        result = render_project(project, tmp_path / "b2.m4b", engine=engine2, assembler=FakeAssembler(), cache_root=cache)
+        assert result.exists()
+        assert len(engine2.calls) == 1
+        assert all(c.audio_path.exists() for c in project.chapters)
+
+    def test_identical_chapters_share_one_wav(self, tmp_path: Path):
+        project = _make_project(num_chapters=0)
+        for i in range(3):
+            project.chapters.append(_make_chapter(index=i, text="Same epigraph."))
+        cache = tmp_path / "cache"
+
+        engine = FakeTTSEngine()
+        render_project(project, tmp_path / "b.m4b", engine=engine, assembler=FakeAssembler(), cache_root=cache)
+        assert len(engine.calls) == 1
+        assert len({c.audio_path for c in project.chapters}) == 1
+
+    def test_superseded_wavs_are_removed(self, tmp_path: Path):
+        project = _make_project(num_chapters=2)
+        cache = tmp_path / "cache"
+        render_project(project, tmp_path / "b1.m4b", engine=FakeTTSEngine(), assembler=FakeAssembler(), cache_root=cache)
+        old_wav = project.chapters[1].audio_path
+
+        project.chapters[1] = _make_chapter(index=1, text="Rewritten chapter.")
+        render_project(project, tmp_path / "b2.m4b", engine=FakeTTSEngine(), assembler=FakeAssembler(), cache_root=cache)
+        assert not old_wav.exists()
+        assert present_wavs(cache) == {c.audio_path.name for c in project.chapters}
+
+    @pytest.mark.parametrize("resume", [True, False])
+    def test_partial_render_keeps_skipped_chapters_wavs(self, tmp_path: Path, resume):
+        cache = tmp_path / "cache"
+        render_project(_make_project(num_chapters=3), tmp_path / "b1.m4b", engine=FakeTTSEngine(), assembler=FakeAssembler(), cache_root=cache)
+        before = present_wavs(cache)
+        assert len(before) == 3
+
+        render_project(
+            _make_project(num_chapters=3), tmp_path / "b2.m4b", engine=FakeTTSEngine(),
+            assembler=FakeAssembler(), cache_root=cache, resume=resume, from_chapter=2,
+            allow_partial=True,
+        )
+        assert present_wavs(cache) == before
+
+    def test_no_resume_keeps_earlier_wavs(self, tmp_path: Path):
+        project = _make_project(num_chapters=2)
+        cache = tmp_path / "cache"
+        render_project(project, tmp_path / "b1.m4b", engine=FakeTTSEngine(), assembler=FakeAssembler(), cache_root=cache)
+        old_wav = project.chapters[1].audio_path
+
+        project.chapters[1] = _make_chapter(index=1, text="Rewritten chapter.")
+        render_project(project, tmp_path / "b2.m4b", engine=FakeTTSEngine(), assembler=FakeAssembler(), cache_root=cache, resume=False)
+        assert old_wav.exists()
+
     def test_changed_casting_rerenders_all(self, tmp_path: Path):
         """Change narrator voice → all chapters invalidated."""
         project = _make_project(num_chapters=2)
@@ -295,14 +535,15 @@ class TestFailedChapterPreservation:
                 cache_root=cache,
             )
 
+        manifest = load_manifest(get_manifest_path(cache))
+        assert manifest is not None
+
         # Chapters 0 and 1 WAVs should exist
         for i in range(2):
-            wav = get_chapter_wav_path(cache, i)
+            wav = manifest.get_entry(i).resolve_wav_path(cache)
             assert wav.exists(), f"Chapter {i} WAV should survive"
 
         # Manifest should show chapters 0-1 ok, chapter 2 failed
-        manifest = load_manifest(get_manifest_path(cache))
-        assert manifest is not None
         assert manifest.get_entry(0).status == "ok"
         assert manifest.get_entry(1).status == "ok"
         assert manifest.get_entry(2).status == "failed"
@@ -337,6 +578,96 @@ class TestFailedChapterPreservation:
         assert len(engine2.calls) == 1  # only chapter 2
 
 
+class TestRenderWorkers:
+    def test_pool_matches_serial(self, tmp_path: Path):
+        serial = _make_project(num_chapters=4)
+        render_project(serial, tmp_path / "s.m4b", engine=FakeTTSEngine(), assembler=FakeAssembler(), cache_root=tmp_path / "s")
+
+        pooled = _make_project(num_chapters=4)
+        pooled.config.render_workers = 3
+        pooled.chapters.append(_make_chapter(index=0, title="Repeat"))
+        engine = FakeTTSEngine()
+        result = render_project(pooled, tmp_path / "p.m4b", engine=engine, assembler=FakeAssembler(), cache_root=tmp_path / "p")
+
+        assert result.exists()
+        assert len(engine.calls) == 4  # the repeated chapter reuses its twin
+        assert [c.audio_path.name for c in pooled.chapters[:4]] == [c.audio_path.name for c in serial.chapters]
+        assert pooled.chapters[4].audio_path == pooled.chapters[0].audio_path
+        manifest = load_manifest(get_manifest_path(tmp_path / "p"))
+        assert [e.status for e in sorted(manifest.chapters, key=lambda e: e.chapter_index)] == ["ok"] * 5
+        assert not list((tmp_path / "p" / "chapters").glob("*.tmp"))
+
+    def test_pool_dispatches_longest_chapters_first(self, tmp_path: Path, caplog):
+        project = _make_project(num_chapters=0)
+        project.config.render_workers = 2
+        for i, words in enumerate([5, 40, 10, 80, 20]):
+            project.chapters.append(_make_chapter(index=i, title=f"W{words}", text=f"Chapter {i} word. " * words))
+
+        with caplog.at_level(logging.INFO, logger="audiobooker.renderer"):
+            render_project(
+                project, tmp_path / "b.m4b",
+                engine=FakeTTSEngine(), assembler=FakeAssembler(), cache_root=tmp_path / "c",
+            )
+        queued = [
+            r.getMessage().split("title=")[1].strip("'")
+            for r in caplog.records if r.getMessage().startswith("RENDER_QUEUED")
+        ]
+        assert queued == ["W80", "W40", "W20", "W10", "W5"]
+        assert [c.audio_path.exists() for c in project.chapters] == [True] * 5
+
+    def test_queued_chapters_not_reported_as_rendering(self, tmp_path: Path):
+        project = _make_project(num_chapters=3)
+        project.config.render_workers = 2
+        release = threading.Event()
+        entered = threading.Semaphore(0)
+
+        class GatedEngine(FakeTTSEngine):
+            def synthesize(self, *args, **kwargs):
+                entered.release()
+                release.wait(5)
+                return super().synthesize(*args, **kwargs)
+
+        rendering = []
+
+        def on_progress(current, total, status):
+            if "Rendering: " in status:
+                rendering.append(status)
+
+        worker = threading.Thread(target=render_project, kwargs={
+            "project": project, "output_path": tmp_path / "b.m4b", "progress_callback": on_progress,
+            "engine": GatedEngine(), "assembler": FakeAssembler(), "cache_root": tmp_path / "c",
+        })
+        worker.start()
+        try:
+            assert entered.acquire(timeout=5) and entered.acquire(timeout=5)
+            time.sleep(0.05)
+            # Both workers are busy; the third chapter is still queued
+            assert len(rendering) <= 2
+        finally:
+            release.set()
+            worker.join(5)
+        assert len(rendering) == 3
+        assert all(c.audio_path.exists() for c in project.chapters)
+
+    def test_pool_failure_raises_and_keeps_finished_audio(self, tmp_path: Path):
+        project = _make_project(num_chapters=3)
+        project.config.render_workers = 2
+        cache = tmp_path / "cache"
+
+        with pytest.raises(RenderError, match="boom"):
+            render_project(
+                project, tmp_path / "book.m4b",
+                engine=FakeTTSEngine(fail_on_call=1, fail_error="boom"),
+                assembler=FakeAssembler(), cache_root=cache,
+            )
+
+        manifest = load_manifest(get_manifest_path(cache))
+        assert len(manifest.failed_chapters()) == 1
+        for entry in manifest.ok_chapters():
+            assert entry.resolve_wav_path(cache).exists()
+        assert not list((cache / "chapters").glob("*.tmp"))
+
+
 class TestRenderSummary:
     def test_summary_on_success(self, tmp_path: Path):
         project = _make_project(num_chapters=2)
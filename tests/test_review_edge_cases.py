@@ -218,6 +218,29 @@ class TestChapterMarkerEdgeCases:
 
         assert stats["chapters_updated"] == 1
 
+    def test_duplicate_titles_match_first_chapter(self, tmp_path):
+        """A marker whose title repeats updates the first such chapter."""
+        from audiobooker.project import AudiobookProject
+
+        project = AudiobookProject(title="Test")
+        project.chapters = [
+            Chapter(index=0, title="Interlude", raw_text=""),
+            Chapter(index=1, title="Interlude", raw_text=""),
+        ]
+
+        review_content = """=== Interlude ===
+
+@narrator
+Content.
+"""
+        review_path = tmp_path / "review.txt"
+        review_path.write_text(review_content, encoding="utf-8")
+
+        import_reviewed(project, review_path)
+
+        assert project.chapters[0].utterances[0].text == "Content."
+        assert project.chapters[1].utterances == []
+
     def test_chapter_pattern_does_not_match_partial(self):
         """Pattern should not match partial markers."""
         # These should NOT match
@@ -431,6 +454,28 @@ A new day began.
         assert "birds sang" in text
         assert "new day" in text
 
+    def test_marker_like_text_stays_text(self, tmp_path):
+        """Lines that start like a marker or tag but don't match are text."""
+        from audiobooker.project import AudiobookProject
+
+        project = AudiobookProject(title="Test")
+        project.chapters = [Chapter(index=0, title="Chapter 1", raw_text="")]
+
+        review_content = """=== Chapter 1 ===
+
+@narrator
+=== not a marker
+@ the sign said
+"""
+        review_path = tmp_path / "review.txt"
+        review_path.write_text(review_content, encoding="utf-8")
+
+        import_reviewed(project, review_path)
+
+        utterances = project.chapters[0].utterances
+        assert len(utterances) == 1
+        assert utterances[0].text == "=== not a marker @ the sign said"
+
 
 class TestEmptyAndEdgeCases:
     """Tests for empty content and edge cases."""